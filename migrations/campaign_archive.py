@@ -0,0 +1,12 @@
+"""
+Add the partial index the campaign archiver scans to campaigns tables created
+before it existed. Fresh databases get it from Base.metadata.create_all().
+"""
+from migrations.indexes import create_index_concurrently
+
+def upgrade(engine):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        create_index_concurrently(
+            connection, 'ix_campaigns_completed_updated_at', "campaigns (updated_at) WHERE status = 'COMPLETED'"
+        )
@@ -0,0 +1,43 @@
+"""
+Add the generated full-text search columns and their GIN indexes to
+campaigns and campaign_tasks tables created before they existed.
+Fresh databases get them from Base.metadata.create_all().
+
+Adding a stored generated column rewrites the table under an ACCESS
+EXCLUSIVE lock, so this is not run at boot. Run it once, off-peak, against
+each database that predates search:
+
+    python -m migrations.campaign_search
+"""
+from sqlalchemy import text
+from migrations.indexes import create_index_concurrently
+from src.models.campaign import CAMPAIGN_SEARCH_EXPRESSION, TASK_SEARCH_EXPRESSION
+
+SEARCH_COLUMNS = (
+    ('campaigns', CAMPAIGN_SEARCH_EXPRESSION, 'ix_campaigns_search_vector'),
+    ('campaign_tasks', TASK_SEARCH_EXPRESSION, 'ix_campaign_tasks_search_vector'),
+)
+
+def missing_tables(engine):
+    """Tables in SEARCH_COLUMNS that do not have search_vector yet"""
+    with engine.connect() as connection:
+        present = set(connection.execute(text(
+            "SELECT table_name FROM information_schema.columns "
+            "WHERE column_name = 'search_vector' AND table_schema = current_schema()"
+        )).scalars())
+    return [table for table, _, _ in SEARCH_COLUMNS if table not in present]
+
+def upgrade(engine):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        for table, expression, index in SEARCH_COLUMNS:
+            connection.execute(text(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                f"GENERATED ALWAYS AS ({expression}) STORED"
+            ))
+            create_index_concurrently(connection, index, f"{table} USING gin (search_vector)")
+
+if __name__ == '__main__':
+    from src.database.connection import engine
+    upgrade(engine)
+    print("✅ Campaign search columns and indexes are in place")
@@ -0,0 +1,46 @@
+"""
+CREATE INDEX CONCURRENTLY for migrations that run while the app serves traffic.
+"""
+from sqlalchemy import text
+import logging
+
+logger = logging.getLogger(__name__)
+
+def create_index_concurrently(connection, index, definition):
+    """
+    Build index (definition is everything after "ON") without blocking writes.
+    A failed concurrent build leaves an INVALID index behind, which IF NOT
+    EXISTS would keep forever; it is dropped and rebuilt unless another build
+    is still in progress. Failures are logged rather than raised, so one bad
+    index does not stop the rest of a migration.
+
+    Args:
+        connection: AUTOCOMMIT connection (CONCURRENTLY cannot run in a transaction)
+        index (str): index name
+        definition (str): e.g. "campaigns (user_id)"
+
+    Returns:
+        bool: True when the index exists and is valid afterwards
+    """
+    try:
+        state = connection.execute(
+            text(
+                "SELECT i.indisvalid, EXISTS ("
+                "  SELECT 1 FROM pg_stat_progress_create_index p WHERE p.index_relid = i.indexrelid"
+                ") AS building "
+                "FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :index"
+            ),
+            {"index": index}
+        ).first()
+        if state is not None and not state.indisvalid:
+            if state.building:
+                logger.info("Index %s is being built by another connection", index)
+                return False
+            logger.warning("Rebuilding invalid index %s left by a failed build", index)
+            connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index}"))
+
+        connection.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON {definition}"))
+        return True
+    except Exception as e:
+        logger.error("Could not create index %s: %s", index, e)
+        return False
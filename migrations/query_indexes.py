@@ -0,0 +1,18 @@
+"""
+Add the indexes behind get_by_user, task lookups and the ordered waitlist
+listing to tables created before they existed. Fresh databases get them from
+Base.metadata.create_all(); tests/test_query_plans.py guards against losing them.
+"""
+from migrations.indexes import create_index_concurrently
+
+INDEXES = (
+    ('ix_campaigns_user_id', 'campaigns', 'user_id'),
+    ('ix_campaign_tasks_campaign_id', 'campaign_tasks', 'campaign_id'),
+    ('ix_waitlist_joined_at', 'waitlist', 'joined_at'),
+)
+
+def upgrade(engine):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        for index, table, column in INDEXES:
+            create_index_concurrently(connection, index, f"{table} ({column})")
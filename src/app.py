@@ -3,9 +3,13 @@ from flask_cors import CORS
 from src.routes.users import users_bp
 from src.routes.campaigns import campaigns_bp
 from src.routes.waitlist import waitlist_bp
+from src.routes.batch import batch_bp
 from src.database.connection import init_db
+from src.database.request_scope import init_request_scope
+from src.services.identity_cache import identity_cache
+from src.utils.logging_setup import init_logging
+from src.utils.response_policy import init_response_policies, response_policy
 import os
-import logging
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,10 +20,10 @@ def create_app():
     # Configure Flask secret key for sessions and security
     app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'dev_secret_key_change_in_production')
     
-    # Production logging
+    # Structured logging written from a background thread, with request ids
+    init_logging(app)
+
     if os.getenv('FLASK_ENV') == 'production':
-        logging.basicConfig(level=logging.INFO)
-        app.logger.setLevel(logging.INFO)
         # Additional security headers for production
         app.config['SESSION_COOKIE_SECURE'] = True
         app.config['SESSION_COOKIE_HTTPONLY'] = True
@@ -39,16 +43,30 @@ def create_app():
         "https://www.xsigned.ai"       # WWW subdomain
     ]
     CORS(app, origins=cors_origins, supports_credentials=True)
+
+    # One lazily-opened session/transaction per request
+    init_request_scope(app)
+
+    # Cache-Control, micro-caching and compression declared per route
+    init_response_policies(app)
     
     # Basic health check (no database required)
     @app.route('/health', methods=['GET'])
+    @response_policy(public=True, max_age=5)
     def health():
         return {"status": "healthy", "version": "1.0.0"}, 200
+
+    # Hit/miss counters of this instance's identity cache
+    @app.route('/cache-status', methods=['GET'])
+    @response_policy(no_store=True)
+    def cache_status():
+        return {"identity_cache": identity_cache.stats()}, 200
     
     # Always register blueprints first
     app.register_blueprint(users_bp)
     app.register_blueprint(campaigns_bp)
     app.register_blueprint(waitlist_bp)
+    app.register_blueprint(batch_bp)
     
     # Database initialization
     db_initialized = False
@@ -63,7 +81,7 @@ def create_app():
             return {"status": "database_connected", "version": "1.0.0"}, 200
             
     except Exception as e:
-        app.logger.error(f"Database initialization failed: {e}")
+        app.logger.error("Database initialization failed: %s", e)
         db_error = str(e)
         # Create a fallback endpoint to show the error
         @app.route('/db-status', methods=['GET'])
@@ -1,12 +1,16 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, scoped_session
+import logging
 import os
 from contextlib import contextmanager
+from contextvars import ContextVar
 from src.database.base import Base
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Database URL - construct from individual environment variables for Cloud Run compatibility
 def get_database_url():
     # Try Cloud Run environment variables first
@@ -34,14 +38,130 @@ DATABASE_URL = get_database_url()
 engine = create_engine(DATABASE_URL, echo=False)
 SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
 
+@event.listens_for(SessionLocal.session_factory, 'after_begin')
+def _apply_read_only(session, transaction, connection):
+    """Issue SET TRANSACTION READ ONLY as the first statement of read-only units of work"""
+    if session.info.get('read_only') and connection.dialect.name == 'postgresql':
+        connection.exec_driver_sql('SET TRANSACTION READ ONLY')
+
+# session.info flag set once the transaction has written rows
+_WRITES_KEY = 'has_writes'
+
+@event.listens_for(SessionLocal.session_factory, 'after_flush')
+def _record_flush(session, flush_context):
+    if session.new or session.dirty or session.deleted:
+        session.info[_WRITES_KEY] = True
+
+@event.listens_for(SessionLocal.session_factory, 'do_orm_execute')
+def _record_bulk_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_WRITES_KEY] = True
+
+@event.listens_for(SessionLocal.session_factory, 'after_commit')
+@event.listens_for(SessionLocal.session_factory, 'after_rollback')
+def _clear_writes(session):
+    session.info.pop(_WRITES_KEY, None)
+
+class UnitOfWork:
+    """
+    One session and transaction shared by everything in a request (or job).
+    The session, and with it a pooled connection, is only checked out on
+    first use; commit/rollback is decided once by whoever opened the unit.
+    """
+
+    def __init__(self, read_only=False):
+        self.read_only = read_only
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = SessionLocal.session_factory(info={'read_only': self.read_only})
+        return self._session
+
+    @property
+    def is_active(self):
+        """True if a session has been opened (i.e. a connection may be held)"""
+        return self._session is not None
+
+    @property
+    def has_uncommitted_writes(self):
+        """True once the transaction has written rows (or has changes waiting to be flushed)"""
+        session = self._session
+        if session is None:
+            return False
+        return bool(session.info.get(_WRITES_KEY) or session.new or session.dirty or session.deleted)
+
+    def commit(self):
+        if self._session is not None:
+            self._session.commit()
+
+    def rollback(self):
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+_current_unit_of_work = ContextVar('current_unit_of_work', default=None)
+
+def current_unit_of_work():
+    """The unit of work active in this context, if any"""
+    return _current_unit_of_work.get()
+
 @contextmanager
-def get_db_session():
-    """Context manager for database sessions"""
-    session = SessionLocal()
+def unit_of_work(read_only=False):
+    """
+    Join the active unit of work, or open one for this block that commits on
+    success and rolls back on error.
+    """
+    current = _current_unit_of_work.get()
+    if current is not None:
+        yield current
+        return
+
+    with separate_unit_of_work(read_only=read_only) as uow:
+        yield uow
+
+@contextmanager
+def separate_unit_of_work(read_only=False):
+    """
+    Open a unit of work of its own for this block, even inside a request or
+    batch, with its own session and connection. For jobs that commit as
+    they go and must not commit the caller's pending writes along the way.
+    Commits on success and rolls back on error.
+    """
+    uow = UnitOfWork(read_only=read_only)
+    token = _current_unit_of_work.set(uow)
+    try:
+        yield uow
+        uow.commit()
+    except Exception:
+        uow.rollback()
+        raise
+    finally:
+        _current_unit_of_work.reset(token)
+        uow.close()
+
+def begin_unit_of_work(read_only=False):
+    """Install a new unit of work for the current context; returns (unit, token)"""
+    uow = UnitOfWork(read_only=read_only)
+    return uow, _current_unit_of_work.set(uow)
+
+def end_unit_of_work(uow, token):
+    """Close a unit of work installed with begin_unit_of_work()"""
     try:
-        yield session
+        uow.close()
     finally:
-        session.close()
+        _current_unit_of_work.reset(token)
+
+@contextmanager
+def get_db_session():
+    """Context manager for database sessions (the active unit of work's session)"""
+    with unit_of_work() as uow:
+        yield uow.session
 
 def init_db():
     """Initialize the database with all tables"""
@@ -49,7 +169,28 @@ def init_db():
     from src.models.user import User
     from src.models.campaign import Campaign, CampaignTask
     from src.models.waitlist import Waitlist  # Add this import
+    from src.models.analytics import SignupRollup, RollupWatermark
+    from src.models.archive import CampaignArchive, CampaignTaskArchive
     
     # Create all tables
     Base.metadata.create_all(bind=engine)
+
+    # Bring tables created by earlier versions up to date. Only online index
+    # builds run at boot (table rewrites such as migrations.campaign_search are
+    # run by hand), and one failing migration must not stop the others
+    from migrations import campaign_archive, query_indexes
+    for migration in (campaign_archive, query_indexes):
+        try:
+            migration.upgrade(engine)
+        except Exception as e:
+            logger.error("Migration %s failed: %s", migration.__name__, e)
+
+    # Writes work without the search columns, but campaign search fails until they exist
+    from migrations import campaign_search
+    missing = campaign_search.missing_tables(engine)
+    if missing:
+        logger.error(
+            "search_vector is missing on %s; campaign search will fail until "
+            "`python -m migrations.campaign_search` has been run", ', '.join(missing)
+        )
     print("✅ Database tables created successfully")
\ No newline at end of file
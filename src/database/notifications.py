@@ -0,0 +1,138 @@
+from sqlalchemy import text
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from src.database.connection import engine
+import json
+import logging
+import os
+import select
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+def notify(session, channel, payload):
+    """
+    Queue a NOTIFY on the session's transaction. Postgres delivers it to
+    listeners only if and when the transaction commits.
+    """
+    session.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": channel, "payload": json.dumps(payload)}
+    )
+
+class PgListener:
+    """
+    Process-wide LISTEN connection. A single background thread holds one
+    dedicated connection (detached from the pool) and dispatches incoming
+    notifications to in-process callbacks, so the number of LISTEN
+    connections is one per instance regardless of how many clients wait on it.
+    """
+
+    def __init__(self, engine, heartbeat_interval=10.0, max_backoff=30.0):
+        self._engine = engine
+        self._heartbeat_interval = heartbeat_interval
+        self._max_backoff = max_backoff
+        self._callbacks = {}
+        self._reconnect_callbacks = []
+        self._listening = set()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._wakeup_read, self._wakeup_write = os.pipe()
+
+    def subscribe(self, channel, callback):
+        """Call callback(payload) for every notification on channel"""
+        with self._lock:
+            self._callbacks.setdefault(channel, []).append(callback)
+            self._ensure_started()
+        os.write(self._wakeup_write, b'\0')
+
+    def on_reconnect(self, callback):
+        """Call callback() once LISTEN is (re-)established; earlier notifications may have been missed"""
+        with self._lock:
+            self._reconnect_callbacks.append(callback)
+
+    def _ensure_started(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='pg-listener', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        backoff = 1.0
+        while True:
+            connection = None
+            try:
+                connection = self._connect()
+                self._sync_channels(connection)
+                self._fire_reconnect()
+                backoff = 1.0
+                self._listen(connection)
+            except Exception as e:
+                logger.warning("LISTEN connection lost, retrying in %.0fs: %s", backoff, e)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+
+    def _connect(self):
+        pooled = self._engine.raw_connection()
+        # Take the driver connection first: detach() drops the proxy's reference
+        connection = pooled.driver_connection
+        pooled.detach()
+        connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        self._listening = set()
+        return connection
+
+    def _listen(self, connection):
+        while True:
+            self._sync_channels(connection)
+            readable, _, _ = select.select(
+                [connection, self._wakeup_read], [], [], self._heartbeat_interval
+            )
+            if self._wakeup_read in readable:
+                os.read(self._wakeup_read, 1024)
+            if not readable:
+                # Nothing arrived; make sure the connection is still alive
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+
+            connection.poll()
+            while connection.notifies:
+                notification = connection.notifies.pop(0)
+                self._dispatch(notification.channel, notification.payload)
+
+    def _sync_channels(self, connection):
+        with self._lock:
+            pending = [channel for channel in self._callbacks if channel not in self._listening]
+        for channel in pending:
+            with connection.cursor() as cursor:
+                cursor.execute(f'LISTEN "{channel}"')
+            self._listening.add(channel)
+
+    def _dispatch(self, channel, payload):
+        with self._lock:
+            callbacks = list(self._callbacks.get(channel, ()))
+        try:
+            data = json.loads(payload) if payload else None
+        except ValueError:
+            logger.warning("Ignoring malformed payload on %s: %r", channel, payload)
+            return
+        for callback in callbacks:
+            try:
+                callback(data)
+            except Exception as e:
+                logger.error("Error handling notification on %s: %s", channel, e)
+
+    def _fire_reconnect(self):
+        with self._lock:
+            callbacks = list(self._reconnect_callbacks)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error("Error in LISTEN reconnect callback: %s", e)
+
+listener = PgListener(engine)
@@ -0,0 +1,59 @@
+from flask import request, jsonify
+from src.database.connection import SessionLocal, current_unit_of_work, begin_unit_of_work, end_unit_of_work
+import logging
+
+logger = logging.getLogger(__name__)
+
+READ_ONLY_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+# Key under which the request that opened a unit of work keeps it; nested
+# requests (e.g. batch sub-requests) join the outer unit instead
+_ENVIRON_KEY = 'xsigned.unit_of_work'
+
+def in_outer_unit_of_work():
+    """True while a request runs inside a unit of work it did not open (e.g. a batch sub-request)"""
+    return current_unit_of_work() is not None and _ENVIRON_KEY not in request.environ
+
+def init_request_scope(app):
+    """
+    Give every request one lazily-opened unit of work. GET requests run
+    read-only; the transaction is committed once when the response is ready
+    (or rolled back for error responses) and the session is released in
+    teardown.
+    """
+
+    @app.before_request
+    def open_unit_of_work():
+        if current_unit_of_work() is None:
+            request.environ[_ENVIRON_KEY] = begin_unit_of_work(read_only=request.method in READ_ONLY_METHODS)
+
+    @app.after_request
+    def finish_unit_of_work(response):
+        owned = request.environ.get(_ENVIRON_KEY)
+        if owned is None:
+            return response
+
+        uow, _ = owned
+        if response.status_code >= 400:
+            uow.rollback()
+            return response
+
+        try:
+            uow.commit()
+        except Exception as e:
+            logger.error("Error committing request transaction: %s", e)
+            uow.rollback()
+            failure = jsonify({"error": "Internal server error"})
+            failure.status_code = 500
+            return failure
+        return response
+
+    @app.teardown_request
+    def close_unit_of_work(exc):
+        owned = request.environ.pop(_ENVIRON_KEY, None)
+        if owned is not None:
+            uow, token = owned
+            if exc is not None:
+                uow.rollback()
+            end_unit_of_work(uow, token)
+        SessionLocal.remove()
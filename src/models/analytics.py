@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from src.database.base import Base
+
+class SignupRollup(Base):
+    """Pre-aggregated row counts per metric and hour bucket"""
+    __tablename__ = 'signup_rollups'
+
+    metric = Column(String(32), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def to_dict(self):
+        return {
+            'bucket_start': self.bucket_start.isoformat() if self.bucket_start else None,
+            'count': self.count
+        }
+
+class RollupWatermark(Base):
+    """Highest source row id already folded into signup_rollups for a metric"""
+    __tablename__ = 'rollup_watermarks'
+
+    metric = Column(String(32), primary_key=True)
+    last_id = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @classmethod
+    def get_for_update(cls, session, metric):
+        """Get the watermark row for a metric, locking it against concurrent rollup runs"""
+        return session.query(cls).filter(cls.metric == metric).with_for_update().first()
@@ -0,0 +1,83 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Enum, Boolean, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from src.database.base import Base
+from src.models.campaign import CampaignStatus
+
+class CampaignArchive(Base):
+    """Cold storage for completed campaigns moved out of the campaigns table"""
+    __tablename__ = 'campaigns_archive'
+    __table_args__ = (
+        Index('ix_campaigns_archive_user_id', 'user_id'),
+    )
+
+    # Same ids as in campaigns, so lookups by id fall through transparently
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=False)
+    name = Column(String(255), nullable=False)
+    status = Column(Enum(CampaignStatus))
+    campaign_data = Column(JSON)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    tasks = relationship(
+        "CampaignTaskArchive",
+        primaryjoin="CampaignArchive.id == foreign(CampaignTaskArchive.campaign_id)",
+        viewonly=True
+    )
+
+    def get_campaign_info(self):
+        """Retrieve campaign information (same shape as Campaign.get_campaign_info)"""
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "name": self.name,
+            "status": self.status.value if self.status else None,
+            "campaign_data": self.campaign_data,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def get_progress_info(self):
+        """Retrieve campaign information together with task completion progress"""
+        tasks = [task.to_dict() for task in self.tasks]
+        return {
+            "campaign": self.get_campaign_info(),
+            "tasks": tasks,
+            "tasks_completed": len([task for task in tasks if task["completed"]]),
+            "tasks_total": len(tasks)
+        }
+
+    @classmethod
+    def get_by_id(cls, session, campaign_id):
+        """Get archived campaign by ID"""
+        return session.query(cls).filter(cls.id == campaign_id).first()
+
+class CampaignTaskArchive(Base):
+    """Cold storage for the tasks of archived campaigns"""
+    __tablename__ = 'campaign_tasks_archive'
+    __table_args__ = (
+        Index('ix_campaign_tasks_archive_campaign_id', 'campaign_id'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    campaign_id = Column(Integer, nullable=False)
+    task_name = Column(String(255), nullable=False)
+    description = Column(String(1000))
+    completed = Column(Boolean, default=False)
+    completed_at = Column(DateTime)
+    created_at = Column(DateTime)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def to_dict(self):
+        """Convert task object to dictionary"""
+        return {
+            "id": self.id,
+            "campaign_id": self.campaign_id,
+            "task_name": self.task_name,
+            "description": self.description,
+            "completed": bool(self.completed),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self.created_at.isoformat() if self.created_at else None
+        }
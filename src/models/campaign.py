@@ -1,5 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Enum, Boolean
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Enum, Boolean, Computed, Index
+from sqlalchemy import func, select, union_all, literal_column, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, sessionmaker, deferred
 from datetime import datetime
 import enum
 from src.database.base import Base
@@ -10,16 +12,45 @@ class CampaignStatus(enum.Enum):
     PAUSED = "paused"
     COMPLETED = "completed"
 
+# Text search configuration; matches default_text_search_config in init-db.sql
+SEARCH_CONFIG = "'english'::regconfig"
+
+# campaign_data keys whose text is searchable alongside the campaign name
+SEARCHABLE_CAMPAIGN_FIELDS = ('description', 'target_audience', 'genre', 'notes')
+
+# Expressions for the generated search_vector columns (must be IMMUTABLE)
+CAMPAIGN_SEARCH_EXPRESSION = (
+    f"setweight(to_tsvector({SEARCH_CONFIG}, coalesce(name, '')), 'A') || "
+    f"setweight(to_tsvector({SEARCH_CONFIG}, "
+    + " || ' ' || ".join(f"coalesce(campaign_data ->> '{field}', '')" for field in SEARCHABLE_CAMPAIGN_FIELDS)
+    + "), 'B')"
+)
+TASK_SEARCH_EXPRESSION = f"to_tsvector({SEARCH_CONFIG}, coalesce(description, ''))"
+
+# Task matches count for less than matches on the campaign itself
+TASK_RANK_WEIGHT = 0.5
+
+HEADLINE_OPTIONS = 'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2'
+
 class Campaign(Base):
     __tablename__ = 'campaigns'
+    __table_args__ = (
+        Index('ix_campaigns_search_vector', 'search_vector', postgresql_using='gin'),
+        # Candidates for archival (see ArchiveService)
+        Index('ix_campaigns_completed_updated_at', 'updated_at', postgresql_where=text("status = 'COMPLETED'")),
+    )
+    # Otherwise every INSERT adds RETURNING search_vector for a value nothing reads
+    __mapper_args__ = {"eager_defaults": False}
     
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     status = Column(Enum(CampaignStatus), default=CampaignStatus.DRAFT)
     campaign_data = Column(JSON)  # For flexible campaign data (renamed from metadata)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Maintained by Postgres; deferred so regular reads don't load it
+    search_vector = deferred(Column(TSVECTOR, Computed(CAMPAIGN_SEARCH_EXPRESSION, persisted=True)))
     
     # Relationships
     user = relationship("User", back_populates="campaigns")
@@ -29,7 +60,7 @@ class Campaign(Base):
         """Create a new campaign record in the database"""
         try:
             session.add(self)
-            session.commit()
+            session.flush()
             return True
         except Exception as e:
             session.rollback()
@@ -42,7 +73,7 @@ class Campaign(Base):
                 if hasattr(self, key):
                     setattr(self, key, value)
             self.updated_at = datetime.utcnow()
-            session.commit()
+            session.flush()
             return True
         except Exception as e:
             session.rollback()
@@ -60,6 +91,16 @@ class Campaign(Base):
             "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
 
+    def get_progress_info(self):
+        """Retrieve campaign information together with task completion progress"""
+        tasks = [task.to_dict() for task in self.tasks]
+        return {
+            "campaign": self.get_campaign_info(),
+            "tasks": tasks,
+            "tasks_completed": len([task for task in tasks if task["completed"]]),
+            "tasks_total": len(tasks)
+        }
+
     @classmethod
     def get_by_id(cls, session, campaign_id):
         """Get campaign by ID"""
@@ -70,21 +111,90 @@ class Campaign(Base):
         """Get all campaigns for a user"""
         return session.query(cls).filter(cls.user_id == user_id).all()
 
+    @classmethod
+    def search(cls, session, terms, user_id=None, limit=20, offset=0):
+        """
+        Full-text search over campaign names, selected campaign_data fields and
+        task descriptions. Returns (campaign, rank, name_highlight,
+        description_highlight) rows, best match first.
+        """
+        query = func.websearch_to_tsquery(literal_column(SEARCH_CONFIG), terms)
+
+        campaign_hits = (
+            select(cls.id.label('campaign_id'), func.ts_rank_cd(cls.search_vector, query).label('rank'))
+            .where(cls.search_vector.op('@@')(query))
+        )
+        task_hits = (
+            select(
+                CampaignTask.campaign_id.label('campaign_id'),
+                (func.ts_rank_cd(CampaignTask.search_vector, query) * TASK_RANK_WEIGHT).label('rank')
+            )
+            .where(CampaignTask.search_vector.op('@@')(query))
+        )
+        if user_id is not None:
+            campaign_hits = campaign_hits.where(cls.user_id == user_id)
+            task_hits = task_hits.join(cls, cls.id == CampaignTask.campaign_id).where(cls.user_id == user_id)
+
+        hits = union_all(campaign_hits, task_hits).subquery()
+        ranked = (
+            select(hits.c.campaign_id, func.max(hits.c.rank).label('rank'))
+            .group_by(hits.c.campaign_id)
+            .order_by(func.max(hits.c.rank).desc(), hits.c.campaign_id.desc())
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+
+        # ts_headline is expensive, so it only runs for the page being returned
+        description = func.coalesce(cls.campaign_data.op('->>')('description'), '')
+        return session.execute(
+            select(
+                cls,
+                ranked.c.rank,
+                func.ts_headline(literal_column(SEARCH_CONFIG), cls.name, query, HEADLINE_OPTIONS),
+                func.ts_headline(literal_column(SEARCH_CONFIG), description, query, HEADLINE_OPTIONS)
+            )
+            .join(ranked, ranked.c.campaign_id == cls.id)
+            .order_by(ranked.c.rank.desc(), cls.id.desc())
+        ).all()
+
 class CampaignTask(Base):
     __tablename__ = 'campaign_tasks'
+    __table_args__ = (
+        Index('ix_campaign_tasks_search_vector', 'search_vector', postgresql_using='gin'),
+    )
+    __mapper_args__ = {"eager_defaults": False}
     
     id = Column(Integer, primary_key=True)
-    campaign_id = Column(Integer, ForeignKey('campaigns.id'), nullable=False)
+    campaign_id = Column(Integer, ForeignKey('campaigns.id'), nullable=False, index=True)
     task_name = Column(String(255), nullable=False)
     description = Column(String(1000))
     completed = Column(Boolean, default=False)
     completed_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
+    search_vector = deferred(Column(TSVECTOR, Computed(TASK_SEARCH_EXPRESSION, persisted=True)))
     
     campaign = relationship("Campaign", back_populates="tasks")
+
+    def to_dict(self):
+        """Convert task object to dictionary"""
+        return {
+            "id": self.id,
+            "campaign_id": self.campaign_id,
+            "task_name": self.task_name,
+            "description": self.description,
+            "completed": bool(self.completed),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self.created_at.isoformat() if self.created_at else None
+        }
+
+    @classmethod
+    def get_for_campaign(cls, session, campaign_id, task_id):
+        """Get a task by ID, scoped to its campaign"""
+        return session.query(cls).filter(cls.id == task_id, cls.campaign_id == campaign_id).first()
     
     def mark_completed(self, session):
         """Mark task as completed"""
         self.completed = True
         self.completed_at = datetime.utcnow()
-        session.commit()
\ No newline at end of file
+        session.flush()
\ No newline at end of file
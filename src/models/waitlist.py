@@ -8,7 +8,7 @@ class Waitlist(Base):
     
     id = Column(Integer, primary_key=True)
     email = Column(String(255), unique=True, nullable=False)
-    joined_at = Column(DateTime, default=datetime.utcnow)
+    joined_at = Column(DateTime, default=datetime.utcnow, index=True)
     is_notified = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     
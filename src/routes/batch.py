@@ -0,0 +1,26 @@
+from flask import Blueprint, request, jsonify, current_app
+from src.services.batch_service import BatchService
+from src.schemas.batch import batch_schema
+from src.utils.validators import validate_body
+import logging
+
+logger = logging.getLogger(__name__)
+
+batch_bp = Blueprint('batch', __name__, url_prefix='/api')
+
+@batch_bp.route('/batch', methods=['POST'])
+@validate_body(batch_schema)
+def execute_batch(body):
+    """Execute several API operations in one round trip endpoint"""
+    try:
+        result, status_code = BatchService.execute(
+            current_app._get_current_object(),
+            body['requests'],
+            atomic=body['atomic'],
+            headers=dict(request.headers)
+        )
+        return jsonify(result), status_code
+
+    except Exception as e:
+        logger.error("Error in execute_batch endpoint: %s", e)
+        return jsonify({"error": "Internal server error"}), 500
@@ -1,27 +1,73 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 from src.services.campaign_service import CampaignService
+from src.services.archive_service import ArchiveService
+from src.services.campaign_events import campaign_events, format_sse
+from src.schemas.campaign import create_campaign_schema, update_campaign_progress_schema, archive_campaigns_schema
+from src.utils.validators import validate_body
+import os
+import queue
+import threading
+import time
 
 campaigns_bp = Blueprint('campaigns', __name__, url_prefix='/api/campaigns')
 
+# Comment line sent when idle so proxies and the client keep the stream open
+SSE_HEARTBEAT_SECONDS = 15
+# Streams are closed periodically; EventSource reconnects after SSE_RETRY_MS
+SSE_MAX_STREAM_SECONDS = 300
+SSE_RETRY_MS = 3000
+# Every open stream holds one gunicorn thread for up to SSE_MAX_STREAM_SECONDS, so
+# keep this well below the thread count (GUNICORN_THREADS in Dockerfile.cloudrun)
+SSE_MAX_STREAMS = int(os.getenv('SSE_MAX_STREAMS', 8))
+# Over the limit clients get 503 and should poll GET /<id>/progress until then
+SSE_BUSY_RETRY_AFTER_SECONDS = 30
+
+_stream_slots = threading.BoundedSemaphore(SSE_MAX_STREAMS)
+
+SEARCH_MAX_PER_PAGE = 100
+SEARCH_MAX_QUERY_LENGTH = 200
+
 @campaigns_bp.route('/', methods=['POST'])
-def create_campaign():
+@validate_body(create_campaign_schema)
+def create_campaign(body):
     """Create a new campaign endpoint"""
     try:
-        data = request.get_json()
+        result, status_code = CampaignService.create_campaign(body['user_id'], body['name'], body['status'])
+        return jsonify(result), status_code
         
-        if not data:
-            return jsonify({"error": "No data provided"}), 400
-            
-        user_id = data.get('user_id')
-        name = data.get('name')
-        status = data.get('status')
+    except Exception as e:
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+@campaigns_bp.route('/archive', methods=['POST'])
+@validate_body(archive_campaigns_schema, optional=True)
+def archive_completed_campaigns(body):
+    """Move old completed campaigns to the archive tables endpoint (admin use)"""
+    try:
+        result, status_code = ArchiveService.archive_completed_campaigns(**body)
+        return jsonify(result), status_code
+
+    except Exception as e:
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
-        if not user_id or not name:
-            return jsonify({'error': 'User ID and name are required'}), 400
+@campaigns_bp.route('/search', methods=['GET'])
+def search_campaigns():
+    """Full-text campaign search endpoint"""
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({"error": "Search query (q) is required"}), 400
+        if len(query) > SEARCH_MAX_QUERY_LENGTH:
+            return jsonify({"error": f"Search query must be at most {SEARCH_MAX_QUERY_LENGTH} characters"}), 400
 
-        result, status_code = CampaignService.create_campaign(user_id, name, status)
+        user_id = request.args.get('user_id', type=int)
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        if page < 1 or not 1 <= per_page <= SEARCH_MAX_PER_PAGE:
+            return jsonify({"error": f"page must be >= 1 and per_page between 1 and {SEARCH_MAX_PER_PAGE}"}), 400
+
+        result, status_code = CampaignService.search_campaigns(query, user_id, page, per_page)
         return jsonify(result), status_code
-        
+
     except Exception as e:
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
@@ -36,16 +82,80 @@ def get_campaign(campaign_id):
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
 @campaigns_bp.route('/<int:campaign_id>/progress', methods=['PATCH'])
-def update_campaign_progress(campaign_id):
+@validate_body(update_campaign_progress_schema)
+def update_campaign_progress(campaign_id, body):
     """Update campaign progress endpoint"""
     try:
-        data = request.get_json()
+        result, status_code = CampaignService.update_campaign_progress(campaign_id, body)
+        return jsonify(result), status_code
         
-        if not data:
-            return jsonify({"error": "No data provided"}), 400
+    except Exception as e:
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+@campaigns_bp.route('/<int:campaign_id>/tasks/<int:task_id>/complete', methods=['POST'])
+def complete_task(campaign_id, task_id):
+    """Mark a campaign task as completed endpoint"""
+    try:
+        result, status_code = CampaignService.complete_task(campaign_id, task_id)
+        return jsonify(result), status_code
+
+    except Exception as e:
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
-        result, status_code = CampaignService.update_campaign_progress(campaign_id, data)
+@campaigns_bp.route('/<int:campaign_id>/progress', methods=['GET'])
+def get_campaign_progress(campaign_id):
+    """Get campaign with task completion progress endpoint (polling fallback for /events)"""
+    try:
+        result, status_code = CampaignService.get_campaign_progress(campaign_id)
         return jsonify(result), status_code
-        
+
+    except Exception as e:
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+@campaigns_bp.route('/<int:campaign_id>/events', methods=['GET'])
+def stream_campaign_events(campaign_id):
+    """Server-Sent Events stream of campaign progress and task completion"""
+    if not _stream_slots.acquire(blocking=False):
+        return jsonify({
+            "error": "Too many open event streams on this instance; poll the progress endpoint instead"
+        }), 503, {'Retry-After': str(SSE_BUSY_RETRY_AFTER_SECONDS)}
+
+    events = None
+
+    def close_stream():
+        if events is not None:
+            campaign_events.unsubscribe(campaign_id, events)
+        _stream_slots.release()
+
+    try:
+        # Subscribe before taking the snapshot so no update can fall in between
+        events = campaign_events.subscribe(campaign_id)
+        result, status_code = CampaignService.get_campaign_progress(campaign_id)
+        if status_code != 200:
+            close_stream()
+            return jsonify(result), status_code
+
     except Exception as e:
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
\ No newline at end of file
+        close_stream()
+        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+
+    def generate():
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        yield format_sse("snapshot", {"event": "snapshot", **result})
+
+        deadline = time.monotonic() + SSE_MAX_STREAM_SECONDS
+        while time.monotonic() < deadline:
+            try:
+                message = events.get(timeout=SSE_HEARTBEAT_SECONDS)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(message["event"], message)
+
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+    # Runs when the server closes the response, even if the body was never iterated
+    response.call_on_close(close_stream)
+    return response
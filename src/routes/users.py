@@ -1,9 +1,13 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, jsonify
 from src.services.user_service import UserService
+from src.schemas.user import create_user_schema, waitlist_signup_schema
+from src.utils.validators import validate_body
+from src.utils.response_policy import response_policy
 
 users_bp = Blueprint('users', __name__, url_prefix='/api/users')
 
 @users_bp.route('/', methods=['GET'])
+@response_policy(no_store=True)
 def get_all_users():
     """Get all users endpoint"""
     try:
@@ -14,24 +18,11 @@ def get_all_users():
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
 @users_bp.route('/', methods=['POST'])
-def create_user():
+@validate_body(create_user_schema)
+def create_user(body):
     """Create a new user endpoint"""
     try:
-        # Get data from request
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"error": "No data provided"}), 400
-        
-        email = data.get('email')
-        artist_name = data.get('artist_name')
-        
-        # Validate required fields
-        if not email:
-            return jsonify({"error": "Email is required"}), 400
-        
-        # Create user using service
-        result, status_code = UserService.create_user(email, artist_name)
+        result, status_code = UserService.create_user(body['email'], body['artist_name'])
         
         return jsonify(result), status_code
         
@@ -49,26 +40,24 @@ def get_user(user_id):
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
 
 @users_bp.route('/health', methods=['GET'])
+@response_policy(public=True, max_age=5)
 def health_check():
     """Health check endpoint"""
     return jsonify({"status": "healthy"}), 200
 
 @users_bp.route('/join_waitlist', methods=['POST'])
-def join_waitlist():
+@validate_body(waitlist_signup_schema)
+def join_waitlist(body):
     """Join waitlist endpoint"""
     try:
-        data = request.get_json()
-        if not data or 'email' not in data:
-            return jsonify({"error": "Email is required"}), 400
-
-        email = data['email']
-        result, status_code = UserService.join_waitlist(email)
+        result, status_code = UserService.join_waitlist(body['email'])
         return jsonify(result), status_code
 
     except Exception as e:
         return jsonify({"error": f"Internal server error: {str(e)}"}), 500
     
 @users_bp.route('/waitlist', methods=['GET'])
+@response_policy(no_store=True)
 def get_waitlist():
     """Get all emails on the waitlist"""
     try:
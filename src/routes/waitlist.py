@@ -1,5 +1,9 @@
 from flask import Blueprint, request, jsonify
 from src.services.waitlist_service import WaitlistService
+from src.services.analytics_service import AnalyticsService
+from src.schemas.user import waitlist_signup_schema
+from src.utils.validators import validate_body
+from src.utils.response_policy import response_policy
 import logging
 
 logger = logging.getLogger(__name__)
@@ -7,29 +11,19 @@ logger = logging.getLogger(__name__)
 waitlist_bp = Blueprint('waitlist', __name__, url_prefix='/api/waitlist')
 
 @waitlist_bp.route('/join', methods=['POST'])
-def join_waitlist():
+@validate_body(waitlist_signup_schema)
+def join_waitlist(body):
     """Join the waitlist endpoint"""
     try:
-        # Get data from request
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"error": "No data provided"}), 400
-        
-        email = data.get('email')
-        
-        if not email:
-            return jsonify({"error": "Email is required"}), 400
-        
-        # Call service to handle the business logic
-        result, status_code = WaitlistService.join_waitlist(email)
+        result, status_code = WaitlistService.join_waitlist(body['email'])
         return jsonify(result), status_code
         
     except Exception as e:
-        logger.error(f"Error in join_waitlist endpoint: {str(e)}")
+        logger.error("Error in join_waitlist endpoint: %s", e)
         return jsonify({"error": "Internal server error"}), 500
 
 @waitlist_bp.route('/stats', methods=['GET'])
+@response_policy(public=True, max_age=30, stale_while_revalidate=60, micro_cache=True)
 def get_waitlist_stats():
     """Get waitlist statistics endpoint"""
     try:
@@ -37,10 +31,40 @@ def get_waitlist_stats():
         return jsonify(result), status_code
         
     except Exception as e:
-        logger.error(f"Error in get_waitlist_stats endpoint: {str(e)}")
+        logger.error("Error in get_waitlist_stats endpoint: %s", e)
+        return jsonify({"error": "Internal server error"}), 500
+
+@waitlist_bp.route('/stats/timeseries', methods=['GET'])
+@response_policy(public=True, max_age=60, stale_while_revalidate=300, micro_cache=True)
+def get_signup_timeseries():
+    """Get signups, new users and new campaigns per hour/day endpoint"""
+    try:
+        metrics = request.args.get('metrics')
+        result, status_code = AnalyticsService.get_timeseries(
+            bucket=request.args.get('bucket', 'hour'),
+            start=request.args.get('from'),
+            end=request.args.get('to'),
+            metrics=metrics.split(',') if metrics else None
+        )
+        return jsonify(result), status_code
+
+    except Exception as e:
+        logger.error("Error in get_signup_timeseries endpoint: %s", e)
+        return jsonify({"error": "Internal server error"}), 500
+
+@waitlist_bp.route('/stats/rollup', methods=['POST'])
+def refresh_signup_rollups():
+    """Fold new rows into the analytics rollups (periodic job, e.g. Cloud Scheduler)"""
+    try:
+        result, status_code = AnalyticsService.refresh_rollups()
+        return jsonify(result), status_code
+
+    except Exception as e:
+        logger.error("Error in refresh_signup_rollups endpoint: %s", e)
         return jsonify({"error": "Internal server error"}), 500
 
 @waitlist_bp.route('/', methods=['GET'])
+@response_policy(no_store=True)
 def get_all_waitlist_entries():
     """Get all waitlist entries endpoint (admin use)"""
     try:
@@ -48,10 +72,11 @@ def get_all_waitlist_entries():
         return jsonify(result), status_code
         
     except Exception as e:
-        logger.error(f"Error in get_all_waitlist_entries endpoint: {str(e)}")
+        logger.error("Error in get_all_waitlist_entries endpoint: %s", e)
         return jsonify({"error": "Internal server error"}), 500
 
 @waitlist_bp.route('/health', methods=['GET'])
+@response_policy(public=True, max_age=5)
 def waitlist_health():
     """Health check for waitlist endpoints"""
     return jsonify({"status": "healthy", "service": "waitlist"}), 200
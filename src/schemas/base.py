@@ -0,0 +1,23 @@
+from marshmallow import EXCLUDE, Schema, fields, validate
+from src.utils.validators import EMAIL_MAX_LENGTH, EMAIL_PATTERN
+
+class RequestSchema(Schema):
+    """Base for request body schemas; unknown keys are dropped rather than rejected"""
+
+    class Meta:
+        unknown = EXCLUDE
+
+class Email(fields.String):
+    """Email address, trimmed and lower-cased"""
+
+    def __init__(self, **kwargs):
+        super().__init__(
+            validate=[
+                validate.Length(max=EMAIL_MAX_LENGTH),
+                validate.Regexp(EMAIL_PATTERN, error="Invalid email format")
+            ],
+            **kwargs
+        )
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        return super()._deserialize(value, attr, data, **kwargs).strip().lower()
@@ -0,0 +1,15 @@
+from marshmallow import fields, validate
+from src.schemas.base import RequestSchema
+from src.services.batch_service import MAX_BATCH_REQUESTS
+
+class BatchSchema(RequestSchema):
+    requests = fields.List(
+        fields.Dict(),
+        required=True,
+        validate=validate.Length(
+            min=1, max=MAX_BATCH_REQUESTS, error=f"Between 1 and {MAX_BATCH_REQUESTS} requests per batch"
+        )
+    )
+    atomic = fields.Boolean(load_default=False)
+
+batch_schema = BatchSchema()
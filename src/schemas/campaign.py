@@ -0,0 +1,32 @@
+from marshmallow import ValidationError, fields, validate, validates_schema
+from src.models.campaign import CampaignStatus
+from src.schemas.base import RequestSchema
+
+_NAME = validate.Length(min=1, max=255)
+
+class CreateCampaignSchema(RequestSchema):
+    user_id = fields.Integer(required=True, validate=validate.Range(min=1))
+    name = fields.String(required=True, validate=_NAME)
+    status = fields.Enum(CampaignStatus, by_value=True, load_default=None)
+
+class UpdateCampaignProgressSchema(RequestSchema):
+    """Only these campaign attributes can be changed through the progress endpoint"""
+    name = fields.String(validate=_NAME)
+    status = fields.Enum(CampaignStatus, by_value=True)
+    campaign_data = fields.Dict(keys=fields.String())
+
+    @validates_schema
+    def require_a_change(self, data, **kwargs):
+        if not data:
+            raise ValidationError("At least one of name, status or campaign_data is required")
+
+class ArchiveCampaignsSchema(RequestSchema):
+    # Omitted values fall back to ArchiveService's defaults
+    older_than_days = fields.Integer(strict=True, validate=validate.Range(min=1))
+    batch_size = fields.Integer(strict=True, validate=validate.Range(min=1))
+    max_batches = fields.Integer(strict=True, validate=validate.Range(min=1))
+    vacuum = fields.Boolean(load_default=False)
+
+create_campaign_schema = CreateCampaignSchema()
+update_campaign_progress_schema = UpdateCampaignProgressSchema()
+archive_campaigns_schema = ArchiveCampaignsSchema()
@@ -0,0 +1,12 @@
+from marshmallow import fields, validate
+from src.schemas.base import RequestSchema, Email
+
+class CreateUserSchema(RequestSchema):
+    email = Email(required=True)
+    artist_name = fields.String(load_default=None, allow_none=True, validate=validate.Length(max=255))
+
+class WaitlistSignupSchema(RequestSchema):
+    email = Email(required=True)
+
+create_user_schema = CreateUserSchema()
+waitlist_signup_schema = WaitlistSignupSchema()
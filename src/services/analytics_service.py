@@ -0,0 +1,181 @@
+from src.models.analytics import SignupRollup, RollupWatermark
+from src.models.waitlist import Waitlist
+from src.models.user import User
+from src.models.campaign import Campaign
+from src.database.connection import get_db_session, separate_unit_of_work
+from sqlalchemy import select, func, literal, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timedelta, timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+# metric name -> (source model, timestamp column bucketed by the rollup)
+ROLLUP_SOURCES = {
+    'waitlist': (Waitlist, Waitlist.joined_at),
+    'users': (User, User.created_at),
+    'campaigns': (Campaign, Campaign.created_at),
+}
+
+# Maximum number of source rows folded into the rollup per metric per run
+ROLLUP_BATCH_SIZE = 50000
+
+# Rows younger than this are left for the next run so that transactions still
+# in flight (which may hold lower ids) have committed before we move past them
+ROLLUP_GRACE_PERIOD = timedelta(seconds=60)
+
+# bucket -> (default range, maximum range) for timeseries queries
+TIMESERIES_BUCKETS = {
+    'hour': (timedelta(days=7), timedelta(days=31)),
+    'day': (timedelta(days=90), timedelta(days=3660)),
+}
+
+class AnalyticsService:
+    """Service for maintaining and reading time-bucketed signup rollups"""
+
+    @staticmethod
+    def refresh_rollups(batch_size=ROLLUP_BATCH_SIZE):
+        """
+        Fold source rows created since each metric's watermark into the
+        hourly rollup table. Safe to run concurrently: the watermark row is
+        locked for the duration of each metric's transaction.
+
+        Returns:
+            tuple: (response_dict, status_code)
+        """
+        try:
+            cutoff = datetime.utcnow() - ROLLUP_GRACE_PERIOD
+            processed = {}
+
+            # Commits per metric, so it must not share (and commit) the request's transaction
+            with separate_unit_of_work() as uow:
+                session = uow.session
+                for metric, (model, ts_column) in ROLLUP_SOURCES.items():
+                    try:
+                        processed[metric] = AnalyticsService._refresh_metric(
+                            session, metric, model, ts_column, cutoff, batch_size
+                        )
+                        session.commit()
+                    except Exception:
+                        session.rollback()
+                        raise
+
+            return {"processed": processed}, 200
+
+        except Exception as e:
+            logger.error("Error refreshing signup rollups: %s", e)
+            return {"error": "Internal server error"}, 500
+
+    @staticmethod
+    def _refresh_metric(session, metric, model, ts_column, cutoff, batch_size):
+        """Fold one batch of new rows for a metric; returns the id range processed"""
+        session.execute(
+            insert(RollupWatermark)
+            .values(metric=metric, last_id=0)
+            .on_conflict_do_nothing(index_elements=['metric'])
+        )
+        watermark = RollupWatermark.get_for_update(session, metric)
+        low = watermark.last_id
+
+        batch = (
+            select(model.id)
+            .where(model.id > low, ts_column < cutoff)
+            .order_by(model.id)
+            .limit(batch_size)
+            .subquery()
+        )
+        high = session.execute(select(func.max(batch.c.id))).scalar()
+        if high is None:
+            return {"from_id": low, "to_id": low}
+
+        bucket = func.date_trunc(literal_column("'hour'"), ts_column)
+        new_counts = (
+            select(literal(metric), bucket, func.count())
+            .where(model.id > low, model.id <= high, ts_column.isnot(None))
+            .group_by(bucket)
+        )
+        upsert = insert(SignupRollup).from_select(['metric', 'bucket_start', 'count'], new_counts)
+        session.execute(
+            upsert.on_conflict_do_update(
+                index_elements=['metric', 'bucket_start'],
+                set_={'count': SignupRollup.count + upsert.excluded.count}
+            )
+        )
+
+        watermark.last_id = high
+        return {"from_id": low, "to_id": high}
+
+    @staticmethod
+    def _parse_timestamp(value):
+        """ISO-8601 string to a naive UTC datetime, matching the timestamp columns"""
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+
+    @staticmethod
+    def get_timeseries(bucket='hour', start=None, end=None, metrics=None):
+        """
+        Read signup/user/campaign counts per bucket from the rollup table.
+        Cost depends only on the requested range, not on table sizes.
+
+        Args:
+            bucket (str): 'hour' or 'day'
+            start (str): ISO-8601 start of range (inclusive)
+            end (str): ISO-8601 end of range (exclusive)
+            metrics (list): subset of ROLLUP_SOURCES keys, defaults to all
+
+        Returns:
+            tuple: (response_dict, status_code)
+        """
+        if bucket not in TIMESERIES_BUCKETS:
+            return {"error": f"bucket must be one of: {', '.join(TIMESERIES_BUCKETS)}"}, 400
+
+        metrics = metrics or list(ROLLUP_SOURCES)
+        unknown = [metric for metric in metrics if metric not in ROLLUP_SOURCES]
+        if unknown:
+            return {"error": f"Unknown metric(s): {', '.join(unknown)}"}, 400
+
+        default_range, max_range = TIMESERIES_BUCKETS[bucket]
+        try:
+            end_at = AnalyticsService._parse_timestamp(end) if end else datetime.utcnow()
+            start_at = AnalyticsService._parse_timestamp(start) if start else end_at - default_range
+            if start_at >= end_at:
+                return {"error": "from must be earlier than to"}, 400
+            too_large = end_at - start_at > max_range
+        except (TypeError, ValueError, OverflowError):
+            return {"error": "from and to must be ISO-8601 timestamps"}, 400
+
+        if too_large:
+            return {"error": f"Range too large for bucket '{bucket}' (max {max_range.days} days)"}, 400
+
+        try:
+            with get_db_session() as session:
+                # bucket is whitelisted above, so it is safe to inline; a bound
+                # parameter would make the GROUP BY expression not match the SELECT
+                bucket_start = func.date_trunc(literal_column(f"'{bucket}'"), SignupRollup.bucket_start)
+                rows = session.execute(
+                    select(SignupRollup.metric, bucket_start, func.sum(SignupRollup.count))
+                    .where(
+                        SignupRollup.metric.in_(metrics),
+                        SignupRollup.bucket_start >= start_at,
+                        SignupRollup.bucket_start < end_at
+                    )
+                    .group_by(SignupRollup.metric, bucket_start)
+                    .order_by(SignupRollup.metric, bucket_start)
+                ).all()
+
+            series = {metric: [] for metric in metrics}
+            for metric, bucket_at, count in rows:
+                series[metric].append({"bucket_start": bucket_at.isoformat(), "count": int(count)})
+
+            return {
+                "bucket": bucket,
+                "from": start_at.isoformat(),
+                "to": end_at.isoformat(),
+                "series": series
+            }, 200
+
+        except Exception as e:
+            logger.error("Error reading signup timeseries: %s", e)
+            return {"error": "Internal server error"}, 500
@@ -0,0 +1,155 @@
+from src.models.campaign import Campaign, CampaignTask, CampaignStatus
+from src.models.archive import CampaignArchive, CampaignTaskArchive
+from src.database.connection import engine, separate_unit_of_work
+from sqlalchemy import select, insert, delete, func, literal, text, bindparam
+from datetime import datetime, timedelta
+import logging
+
+logger = logging.getLogger(__name__)
+
+CAMPAIGN_COLUMNS = ('id', 'user_id', 'name', 'status', 'campaign_data', 'created_at', 'updated_at')
+TASK_COLUMNS = ('id', 'campaign_id', 'task_name', 'description', 'completed', 'completed_at', 'created_at')
+
+HOT_TABLES = ('campaigns', 'campaign_tasks')
+ARCHIVE_TABLES = ('campaigns_archive', 'campaign_tasks_archive')
+
+class ArchiveService:
+    """Service for moving completed campaigns out of the hot tables"""
+
+    @staticmethod
+    def archive_completed_campaigns(older_than_days=90, batch_size=500, max_batches=100, vacuum=False):
+        """
+        Move COMPLETED campaigns not updated for older_than_days, with their
+        tasks, into the archive tables. Each batch is its own transaction and
+        skips rows locked by concurrent writers.
+
+        Args:
+            older_than_days (int): minimum age since the last update
+            batch_size (int): campaigns moved per transaction
+            max_batches (int): upper bound on batches per run
+            vacuum (bool): VACUUM ANALYZE the hot tables afterwards so the
+                space of the moved rows (bytes_moved) is reused by new rows.
+                Plain VACUUM only gives trailing empty pages back to the
+                OS, so hot_bytes_released usually stays near 0
+
+        Returns:
+            tuple: (response_dict, status_code)
+        """
+        try:
+            cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+            run_at = datetime.utcnow()
+            campaigns_archived = 0
+            tasks_archived = 0
+            bytes_moved = 0
+            batches = 0
+
+            # Commits per batch, so it must not share (and commit) the request's transaction
+            with separate_unit_of_work() as uow:
+                session = uow.session
+                sizes_before = ArchiveService._relation_sizes(session)
+
+                for _ in range(max_batches):
+                    campaign_ids = session.execute(
+                        select(Campaign.id)
+                        .where(Campaign.status == CampaignStatus.COMPLETED, Campaign.updated_at < cutoff)
+                        .order_by(Campaign.updated_at)
+                        .limit(batch_size)
+                        .with_for_update(skip_locked=True)
+                    ).scalars().all()
+                    if not campaign_ids:
+                        break
+
+                    try:
+                        # Tasks first: they reference the campaigns being removed
+                        tasks, task_bytes = ArchiveService._move(
+                            session, CampaignTask, CampaignTaskArchive, TASK_COLUMNS,
+                            CampaignTask.campaign_id.in_(campaign_ids), run_at
+                        )
+                        campaigns, campaign_bytes = ArchiveService._move(
+                            session, Campaign, CampaignArchive, CAMPAIGN_COLUMNS,
+                            Campaign.id.in_(campaign_ids), run_at
+                        )
+                        session.commit()
+                        tasks_archived += tasks
+                        campaigns_archived += campaigns
+                        bytes_moved += task_bytes + campaign_bytes
+                        batches += 1
+                    except Exception:
+                        session.rollback()
+                        raise
+
+            if vacuum and campaigns_archived:
+                ArchiveService._vacuum(HOT_TABLES)
+
+            with separate_unit_of_work(read_only=True) as uow:
+                sizes_after = ArchiveService._relation_sizes(uow.session)
+
+            hot_before = sum(sizes_before[table] for table in HOT_TABLES)
+            hot_after = sum(sizes_after[table] for table in HOT_TABLES)
+
+            logger.info(
+                "Archived %s campaigns and %s tasks (%s bytes) in %s batches",
+                campaigns_archived, tasks_archived, bytes_moved, batches
+            )
+
+            return {
+                "campaigns_archived": campaigns_archived,
+                "tasks_archived": tasks_archived,
+                "batches": batches,
+                "cutoff": cutoff.isoformat(),
+                "bytes_moved": bytes_moved,
+                "hot_bytes_released": hot_before - hot_after,
+                "relation_sizes": {"before": sizes_before, "after": sizes_after},
+                "vacuumed": bool(vacuum and campaigns_archived)
+            }, 200
+
+        except Exception as e:
+            logger.error("Error archiving campaigns: %s", e)
+            return {"error": "Internal server error"}, 500
+
+    @staticmethod
+    def _move(session, source, target, columns, condition, run_at):
+        """
+        DELETE ... RETURNING from the hot table straight into the archive
+        table; returns (rows moved, their on-disk size in bytes)
+        """
+        table = source.__table__
+        moved = (
+            delete(table)
+            .where(condition)
+            .returning(*[table.c[name] for name in columns], func.pg_column_size(table.table_valued()).label('row_size'))
+            .cte('moved')
+        )
+        archived = (
+            insert(target.__table__)
+            .from_select(
+                [*columns, 'archived_at'],
+                select(*[moved.c[name] for name in columns], literal(run_at))
+            )
+            .cte('archived')
+        )
+        # Postgres runs the INSERT although the outer query never reads it
+        rows, size = session.execute(
+            select(func.count(), func.coalesce(func.sum(moved.c.row_size), 0))
+            .select_from(moved)
+            .add_cte(archived)
+        ).one()
+        return rows, int(size)
+
+    @staticmethod
+    def _relation_sizes(session):
+        """Total size (heap, indexes and TOAST) of the hot and archive tables"""
+        rows = session.execute(
+            text("SELECT relname, pg_total_relation_size(oid) FROM pg_class WHERE relname IN :names AND relkind = 'r'")
+            .bindparams(bindparam('names', value=list(HOT_TABLES + ARCHIVE_TABLES), expanding=True))
+        ).all()
+        sizes = {table: 0 for table in HOT_TABLES + ARCHIVE_TABLES}
+        sizes.update({name: int(size) for name, size in rows})
+        return sizes
+
+    @staticmethod
+    def _vacuum(tables):
+        # VACUUM cannot run inside a transaction block
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            for table in tables:
+                connection.execute(text(f"VACUUM (ANALYZE) {table}"))
@@ -0,0 +1,157 @@
+from src.database.connection import unit_of_work
+from flask import request
+from urllib.parse import urlsplit
+from werkzeug.test import EnvironBuilder
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_REQUESTS = 20
+ALLOWED_METHODS = {'GET', 'POST', 'PUT', 'PATCH', 'DELETE'}
+
+# Headers of the batch request that are not forwarded to sub-requests; sub-responses
+# are embedded in the batch response, which is compressed as a whole
+EXCLUDED_HEADERS = {'content-type', 'content-length', 'transfer-encoding', 'accept-encoding'}
+
+# "{{ <id or index>.path.to.value }}" refers to the body of an earlier response
+# Sub-requests may not run batches themselves, however the path is spelled
+BATCH_ENDPOINT = 'batch.execute_batch'
+_PATH_ERROR = "path must be an /api/ route other than /api/batch"
+
+REFERENCE_PATTERN = re.compile(r'\{\{\s*([\w-]+)((?:\.[\w-]+)*)\s*\}\}')
+
+class BatchReferenceError(ValueError):
+    """Raised when a sub-request refers to a result that is not available"""
+
+class BatchService:
+    """Service for executing several API operations in one round trip"""
+
+    @staticmethod
+    def execute(app, operations, atomic=False, headers=None):
+        """
+        Run sub-requests in order against the app's own routes within one
+        unit of work, so they share one database session.
+
+        Args:
+            app (Flask): application to dispatch to
+            operations (list): dicts with method, path, optional body and id
+            atomic (bool): run everything in one transaction and stop at the
+                first failure, rolling all previous operations back; otherwise
+                each successful operation is committed on its own
+            headers (dict): headers forwarded to every sub-request
+
+        Returns:
+            tuple: (response_dict, status_code)
+        """
+        forwarded = {
+            key: value for key, value in (headers or {}).items()
+            if key.lower() not in EXCLUDED_HEADERS
+        }
+        responses = []
+        failed = None
+
+        # Sub-requests join this unit of work, so they share one session and
+        # connection; services only flush, the batch decides when to commit
+        with unit_of_work() as uow:
+            for index, operation in enumerate(operations):
+                response = BatchService._run_operation(app, index, operation, responses, forwarded)
+                responses.append(response)
+
+                if atomic:
+                    if response["status"] >= 400:
+                        failed = response
+                        uow.rollback()
+                        break
+                elif response["status"] >= 400:
+                    uow.rollback()
+                else:
+                    uow.commit()
+
+            if failed is None:
+                uow.commit()
+
+        result = {"committed": failed is None, "responses": responses}
+        if failed is not None:
+            return result, failed["status"]
+        return result, 200
+
+    @staticmethod
+    def _run_operation(app, index, operation, previous, headers):
+        """Dispatch a single sub-request; returns {"id", "status", "body"}"""
+        op_id = operation.get("id", str(index))
+        method = str(operation.get("method", "GET")).upper()
+
+        try:
+            path = BatchService._resolve(operation.get("path"), previous)
+            body = BatchService._resolve(operation.get("body"), previous)
+        except BatchReferenceError as e:
+            return {"id": op_id, "status": 400, "body": {"error": str(e)}}
+
+        if method not in ALLOWED_METHODS:
+            return {"id": op_id, "status": 405, "body": {"error": f"Method {method} is not allowed"}}
+        if not isinstance(path, str) or not urlsplit(path).path.startswith('/api/'):
+            return {"id": op_id, "status": 400, "body": {"error": _PATH_ERROR}}
+
+        builder = EnvironBuilder(
+            path=path,
+            method=method,
+            json=body if body is not None and method != 'GET' else None,
+            headers=headers
+        )
+        try:
+            with app.request_context(builder.get_environ()):
+                if request.url_rule is not None and request.url_rule.endpoint == BATCH_ENDPOINT:
+                    return {"id": op_id, "status": 400, "body": {"error": _PATH_ERROR}}
+                response = app.full_dispatch_request()
+        except Exception as e:
+            logger.error("Error in batch operation %s (%s %s): %s", op_id, method, path, e)
+            return {"id": op_id, "status": 500, "body": {"error": "Internal server error"}}
+        finally:
+            builder.close()
+
+        if response.is_streamed:
+            response.close()
+            return {"id": op_id, "status": 400, "body": {"error": "Streaming endpoints cannot be batched"}}
+
+        payload = response.get_json(silent=True)
+        if payload is None:
+            payload = response.get_data(as_text=True)
+        return {"id": op_id, "status": response.status_code, "body": payload}
+
+    @staticmethod
+    def _resolve(value, previous):
+        """Substitute {{ref}} placeholders with values from earlier responses"""
+        if isinstance(value, dict):
+            return {key: BatchService._resolve(item, previous) for key, item in value.items()}
+        if isinstance(value, list):
+            return [BatchService._resolve(item, previous) for item in value]
+        if not isinstance(value, str) or '{{' not in value:
+            return value
+
+        whole = REFERENCE_PATTERN.fullmatch(value.strip())
+        if whole:
+            # A lone placeholder keeps the referenced value's type (e.g. int ids)
+            return BatchService._lookup(whole, previous)
+        return REFERENCE_PATTERN.sub(lambda match: str(BatchService._lookup(match, previous)), value)
+
+    @staticmethod
+    def _lookup(match, previous):
+        ref, path = match.group(1), match.group(2)
+        target = next((response for response in previous if response["id"] == ref), None)
+        if target is None and ref.isdigit() and int(ref) < len(previous):
+            target = previous[int(ref)]
+        if target is None:
+            raise BatchReferenceError(f"Unknown reference '{ref}'")
+        if target["status"] >= 400:
+            raise BatchReferenceError(f"Referenced operation '{ref}' failed")
+
+        value = target["body"]
+        for key in filter(None, path.split('.')):
+            if isinstance(value, list) and key.isdigit() and int(key) < len(value):
+                value = value[int(key)]
+            elif isinstance(value, dict) and key in value:
+                value = value[key]
+            else:
+                raise BatchReferenceError(f"'{match.group(0)}' does not resolve to a value")
+        return value
@@ -0,0 +1,91 @@
+from src.models.campaign import Campaign
+from src.database.connection import get_db_session
+from src.database.notifications import listener, notify
+import json
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+CAMPAIGN_EVENTS_CHANNEL = 'campaign_events'
+
+# Per-client buffer; every message is a full snapshot so dropping old ones is safe
+SUBSCRIBER_QUEUE_SIZE = 16
+
+def publish_campaign_event(session, campaign_id, event, **details):
+    """Announce a campaign change; delivered to listeners when the session commits"""
+    notify(session, CAMPAIGN_EVENTS_CHANNEL, {"campaign_id": campaign_id, "event": event, **details})
+
+def format_sse(event, data):
+    """Encode a Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+class CampaignEventHub:
+    """
+    Fans campaign notifications out to the SSE streams open on this instance.
+    The campaign is loaded once per notification (not once per client) and
+    only if someone on this instance is watching it.
+    """
+
+    def __init__(self, listener):
+        self._listener = listener
+        self._subscribers = {}
+        self._lock = threading.Lock()
+        self._registered = False
+
+    def subscribe(self, campaign_id):
+        """Register interest in a campaign; returns the queue updates are pushed to"""
+        events = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            if not self._registered:
+                self._listener.on_reconnect(self._on_reconnect)
+                self._listener.subscribe(CAMPAIGN_EVENTS_CHANNEL, self._on_notification)
+                self._registered = True
+            self._subscribers.setdefault(campaign_id, set()).add(events)
+        return events
+
+    def unsubscribe(self, campaign_id, events):
+        with self._lock:
+            subscribers = self._subscribers.get(campaign_id)
+            if subscribers is not None:
+                subscribers.discard(events)
+                if not subscribers:
+                    del self._subscribers[campaign_id]
+
+    def _on_notification(self, payload):
+        campaign_id = payload.get("campaign_id")
+        self._broadcast(campaign_id, payload.get("event", "update"))
+
+    def _on_reconnect(self):
+        # Notifications sent while we were disconnected are lost, so resend
+        # the current state of everything being watched
+        with self._lock:
+            campaign_ids = list(self._subscribers)
+        for campaign_id in campaign_ids:
+            self._broadcast(campaign_id, "resync")
+
+    def _broadcast(self, campaign_id, event):
+        with self._lock:
+            subscribers = list(self._subscribers.get(campaign_id, ()))
+        if not subscribers:
+            return
+
+        with get_db_session() as session:
+            campaign = Campaign.get_by_id(session, campaign_id)
+            if not campaign:
+                return
+            message = {"event": event, **campaign.get_progress_info()}
+
+        for events in subscribers:
+            while True:
+                try:
+                    events.put_nowait(message)
+                    break
+                except queue.Full:
+                    try:
+                        events.get_nowait()
+                    except queue.Empty:
+                        pass
+
+campaign_events = CampaignEventHub(listener)
@@ -1,14 +1,24 @@
-from src.models.campaign import Campaign, CampaignStatus
+from src.models.campaign import Campaign, CampaignTask, CampaignStatus
+from src.models.archive import CampaignArchive
 from src.database.connection import get_db_session
+from src.services.campaign_events import publish_campaign_event
+from src.services.identity_cache import identity_cache, CAMPAIGN
 from sqlalchemy.exc import IntegrityError
 
 class CampaignService:
     
+    @staticmethod
+    def _coerce_status(status):
+        """CampaignStatus from an enum member or its value (e.g. "active"); raises ValueError"""
+        return status if isinstance(status, CampaignStatus) else CampaignStatus(status)
+
     @staticmethod
     def create_campaign(user_id, name, status=None):
         """Create a new campaign"""
-        if status is None:
-            status = CampaignStatus.DRAFT
+        try:
+            status = CampaignService._coerce_status(status) if status is not None else CampaignStatus.DRAFT
+        except ValueError:
+            return {"error": f"Invalid status: {status}"}, 400
             
         with get_db_session() as session:
             try:
@@ -18,7 +28,7 @@ class CampaignService:
                     status=status
                 )
                 session.add(new_campaign)
-                session.commit()
+                session.flush()
                 return {"campaign": new_campaign.get_campaign_info(), "message": "Campaign created successfully"}, 201
                 
             except Exception as e:
@@ -28,13 +38,23 @@ class CampaignService:
     @staticmethod
     def get_campaign(campaign_id):
         """Get campaign by ID"""
+        cached = identity_cache.get(CAMPAIGN, campaign_id)
+        if cached is not None:
+            return {"campaign": cached}, 200
+
+        generation = identity_cache.generation(CAMPAIGN)
         with get_db_session() as session:
             try:
-                campaign = Campaign.get_by_id(session, campaign_id)
+                # Completed campaigns may have been moved to the archive; archiving
+                # doesn't change what get_campaign_info() returns, so cached
+                # entries stay valid across it
+                campaign = Campaign.get_by_id(session, campaign_id) or CampaignArchive.get_by_id(session, campaign_id)
                 if not campaign:
                     return {"error": "Campaign not found"}, 404
                     
-                return {"campaign": campaign.get_campaign_info()}, 200
+                campaign_info = campaign.get_campaign_info()
+                identity_cache.set(CAMPAIGN, campaign_id, campaign_info, generation)
+                return {"campaign": campaign_info}, 200
                 
             except Exception as e:
                 return {"error": f"Failed to retrieve campaign: {str(e)}"}, 500
@@ -42,12 +62,22 @@ class CampaignService:
     @staticmethod
     def update_campaign_progress(campaign_id, progress_data):
         """Update campaign progress"""
+        if 'status' in progress_data:
+            try:
+                progress_data = {**progress_data, 'status': CampaignService._coerce_status(progress_data['status'])}
+            except ValueError:
+                return {"error": f"Invalid status: {progress_data['status']}"}, 400
+
         with get_db_session() as session:
             try:
                 campaign = Campaign.get_by_id(session, campaign_id)
                 if not campaign:
                     return {"error": "Campaign not found"}, 404
                 
+                # Queued on this transaction, so watchers only hear about committed changes
+                publish_campaign_event(session, campaign_id, "progress")
+                identity_cache.invalidate(session, CAMPAIGN, campaign_id)
+
                 # Update campaign with progress data
                 campaign.update_campaign(session, progress_data)
                 
@@ -57,8 +87,63 @@ class CampaignService:
                 session.rollback()
                 return {"error": f"Failed to update campaign: {str(e)}"}, 500
 
-    def get_campaign(self, campaign_id):
-        return self.db.session.query(Campaign).filter_by(id=campaign_id).first()
+    @staticmethod
+    def get_campaign_progress(campaign_id):
+        """Get campaign with its task completion progress"""
+        with get_db_session() as session:
+            try:
+                campaign = Campaign.get_by_id(session, campaign_id) or CampaignArchive.get_by_id(session, campaign_id)
+                if not campaign:
+                    return {"error": "Campaign not found"}, 404
+
+                return campaign.get_progress_info(), 200
 
-    def get_all_campaigns(self):
-        return self.db.session.query(Campaign).all()
\ No newline at end of file
+            except Exception as e:
+                return {"error": f"Failed to retrieve campaign: {str(e)}"}, 500
+
+    @staticmethod
+    def complete_task(campaign_id, task_id):
+        """Mark a campaign task as completed"""
+        with get_db_session() as session:
+            try:
+                task = CampaignTask.get_for_campaign(session, campaign_id, task_id)
+                if not task:
+                    return {"error": "Task not found"}, 404
+
+                publish_campaign_event(session, campaign_id, "task_completed", task_id=task_id)
+                task.mark_completed(session)
+
+                return {"task": task.to_dict(), "message": "Task completed successfully"}, 200
+
+            except Exception as e:
+                session.rollback()
+                return {"error": f"Failed to complete task: {str(e)}"}, 500
+
+    @staticmethod
+    def search_campaigns(query, user_id=None, page=1, per_page=20):
+        """Full-text search over campaigns, ranked and paginated with highlighted matches"""
+        with get_db_session() as session:
+            try:
+                # Fetch one extra row to learn whether another page exists without counting all matches
+                rows = Campaign.search(
+                    session, query, user_id=user_id, limit=per_page + 1, offset=(page - 1) * per_page
+                )
+
+                results = [
+                    {
+                        "campaign": campaign.get_campaign_info(),
+                        "rank": float(rank),
+                        "highlights": {"name": name_highlight, "description": description_highlight}
+                    }
+                    for campaign, rank, name_highlight, description_highlight in rows[:per_page]
+                ]
+
+                return {
+                    "results": results,
+                    "page": page,
+                    "per_page": per_page,
+                    "has_more": len(rows) > per_page
+                }, 200
+
+            except Exception as e:
+                return {"error": f"Failed to search campaigns: {str(e)}"}, 500
@@ -0,0 +1,105 @@
+from sqlalchemy import event
+from src.database.connection import SessionLocal, current_unit_of_work
+from src.database.notifications import listener, notify
+from src.utils.cache import LRUCache
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+IDENTITY_CACHE_CHANNEL = 'identity_cache'
+IDENTITY_CACHE_MAX_ENTRIES = int(os.getenv('IDENTITY_CACHE_MAX_ENTRIES', 10000))
+IDENTITY_CACHE_TTL_SECONDS = float(os.getenv('IDENTITY_CACHE_TTL_SECONDS', 60))
+
+USER = 'user'
+CAMPAIGN = 'campaign'
+
+# session.info key holding invalidations to apply locally once the transaction commits
+_PENDING_KEY = 'identity_cache_invalidations'
+
+class IdentityCache:
+    """
+    Per-instance cache of serialized user and campaign rows, keyed by id.
+    Writers queue a NOTIFY on their transaction, so every instance (this one
+    included) drops the entry when the write commits. Notifications missed
+    while the LISTEN connection was down are covered by clearing everything
+    on reconnect; the TTL bounds staleness if all else fails.
+
+    A unit of work that has written anything bypasses the cache until it
+    ends: it must see its own writes, and what it reads may still be rolled back.
+
+    Cached values are shared between requests and must not be mutated.
+    """
+
+    def __init__(self, listener, max_entries=IDENTITY_CACHE_MAX_ENTRIES, ttl_seconds=IDENTITY_CACHE_TTL_SECONDS):
+        self._listener = listener
+        self._caches = {kind: LRUCache(max_entries, ttl_seconds) for kind in (USER, CAMPAIGN)}
+        self._lock = threading.Lock()
+        self._registered = False
+        self._bypassed = {kind: 0 for kind in self._caches}
+
+    def get(self, kind, key):
+        """Cached value or None"""
+        if _has_uncommitted_writes():
+            self._bypassed[kind] += 1
+            return None
+        return self._caches[kind].get(key)
+
+    def generation(self, kind):
+        """Take before loading a row from the database; pass to set()"""
+        return self._caches[kind].generation()
+
+    def set(self, kind, key, value, generation):
+        """Cache value unless an invalidation for this kind arrived since generation was taken"""
+        if _has_uncommitted_writes():
+            return
+        self._ensure_listening()
+        self._caches[kind].set(key, value, generation)
+
+    def invalidate(self, session, kind, *keys):
+        """Drop entries on every instance once the session's transaction commits"""
+        notify(session, IDENTITY_CACHE_CHANNEL, {"kind": kind, "ids": list(keys)})
+        session.info.setdefault(_PENDING_KEY, []).append((kind, keys))
+
+    def stats(self):
+        return {kind: {**cache.stats(), "bypassed": self._bypassed[kind]} for kind, cache in self._caches.items()}
+
+    def _ensure_listening(self):
+        # Nothing is cached before the first set(), so LISTEN starts lazily
+        with self._lock:
+            if self._registered:
+                return
+            self._listener.on_reconnect(self._on_reconnect)
+            self._listener.subscribe(IDENTITY_CACHE_CHANNEL, self._on_notification)
+            self._registered = True
+
+    def _apply(self, kind, keys):
+        cache = self._caches.get(kind)
+        if cache is not None:
+            cache.invalidate(*keys)
+
+    def _on_notification(self, payload):
+        self._apply(payload.get("kind"), payload.get("ids", ()))
+
+    def _on_reconnect(self):
+        for cache in self._caches.values():
+            cache.clear()
+
+def _has_uncommitted_writes():
+    uow = current_unit_of_work()
+    if uow is None or not uow.is_active:
+        return False
+    return uow.has_uncommitted_writes or bool(uow.session.info.get(_PENDING_KEY))
+
+identity_cache = IdentityCache(listener)
+
+@event.listens_for(SessionLocal.session_factory, 'after_commit')
+def _invalidate_after_commit(session):
+    # Apply locally right away instead of waiting for our own NOTIFY to loop back
+    for kind, keys in session.info.pop(_PENDING_KEY, ()):
+        identity_cache._apply(kind, keys)
+
+@event.listens_for(SessionLocal.session_factory, 'after_rollback')
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
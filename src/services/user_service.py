@@ -1,22 +1,17 @@
 from src.models.user import User
 from src.models.waitlist import Waitlist  # Add this import
 from src.database.connection import get_db_session
+from src.services.identity_cache import identity_cache, USER
+from src.utils.validators import is_valid_email
 from sqlalchemy.exc import IntegrityError
-import re
 
 class UserService:
     
-    @staticmethod
-    def validate_email(email):
-        """Basic email validation"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
-    
     @staticmethod
     def create_user(email, artist_name=None):
         """Create a new user"""
         # Validate email format
-        if not UserService.validate_email(email):
+        if not is_valid_email(email):
             return {"error": "Invalid email format"}, 400
         
         with get_db_session() as session:
@@ -33,7 +28,7 @@ class UserService:
                 )
                 
                 session.add(new_user)
-                session.commit()
+                session.flush()
                 
                 return {"user": new_user.to_dict(), "message": "User created successfully"}, 201
                 
@@ -47,13 +42,20 @@ class UserService:
     @staticmethod
     def get_user_by_id(user_id):
         """Get user by ID"""
+        cached = identity_cache.get(USER, user_id)
+        if cached is not None:
+            return {"user": cached}, 200
+
+        generation = identity_cache.generation(USER)
         with get_db_session() as session:
             try:
                 user = User.get_by_id(session, user_id)
                 if not user:
                     return {"error": "User not found"}, 404
                 
-                return {"user": user.to_dict()}, 200
+                user_data = user.to_dict()
+                identity_cache.set(USER, user_id, user_data, generation)
+                return {"user": user_data}, 200
                 
             except Exception as e:
                 return {"error": f"Failed to retrieve user: {str(e)}"}, 500
@@ -76,7 +78,7 @@ class UserService:
     def join_waitlist(email):
         """Add email to waitlist"""
         # Validate email format
-        if not UserService.validate_email(email):
+        if not is_valid_email(email):
             return {"error": "Invalid email format"}, 400
         
         with get_db_session() as session:
@@ -89,7 +91,7 @@ class UserService:
                 # Create new waitlist entry
                 new_entry = Waitlist(email=email.lower().strip())
                 session.add(new_entry)
-                session.commit()
+                session.flush()
                 
                 # Get total count for response
                 total_count = Waitlist.count_total(session)
@@ -41,12 +41,12 @@ class WaitlistService:
                     # Create new waitlist entry
                     waitlist_entry = Waitlist(email=email)
                     session.add(waitlist_entry)
-                    session.commit()
+                    session.flush()
                     
                     # Get total count for response
                     total_count = Waitlist.count_total(session)
                     
-                    logger.info(f"New waitlist signup: {email}")
+                    logger.info("New waitlist signup: %s", email)
                     
                     return {
                         "success": True,
@@ -58,11 +58,11 @@ class WaitlistService:
                     
                 except Exception as e:
                     session.rollback()
-                    logger.error(f"Database error adding {email} to waitlist: {str(e)}")
+                    logger.error("Database error adding %s to waitlist: %s", email, e)
                     return {"error": "Failed to join waitlist"}, 500
                 
         except Exception as e:
-            logger.error(f"Error in join_waitlist: {str(e)}")
+            logger.error("Error in join_waitlist: %s", e)
             return {"error": "Internal server error"}, 500
     
     @staticmethod
@@ -83,7 +83,7 @@ class WaitlistService:
                 }, 200
                 
         except Exception as e:
-            logger.error(f"Error getting waitlist stats: {str(e)}")
+            logger.error("Error getting waitlist stats: %s", e)
             return {"error": "Internal server error"}, 500
     
     @staticmethod
@@ -105,5 +105,5 @@ class WaitlistService:
                 }, 200
                 
         except Exception as e:
-            logger.error(f"Error getting waitlist entries: {str(e)}")
+            logger.error("Error getting waitlist entries: %s", e)
             return {"error": "Internal server error"}, 500
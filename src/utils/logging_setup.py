@@ -0,0 +1,199 @@
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from flask import request
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import time
+import uuid
+
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json' if os.getenv('FLASK_ENV') == 'production' else 'text')
+# Fraction of INFO/DEBUG records kept; warnings, errors and access lines are never sampled
+LOG_INFO_SAMPLE_RATE = float(os.getenv('LOG_INFO_SAMPLE_RATE', 1.0))
+# Records buffered for the writer thread; beyond this they are dropped rather than block a request
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+# One line per request; the only record of most requests, so never sampled
+ACCESS_LOGGER = 'xsigned.access'
+
+# Argument types safe to render later on the writer thread
+_LAZY_ARG_TYPES = (str, int, float, bool, type(None))
+
+# Attributes every LogRecord has; anything else was passed via extra=
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'request_id'}
+
+_ENVIRON_KEY = 'xsigned.request_log'
+
+_request_id = ContextVar('request_id', default=None)
+
+_listener = None
+_queue_handler = None
+
+class RequestContextFilter(logging.Filter):
+    """Stamp records with the id of the request being handled on this thread"""
+
+    def filter(self, record):
+        record.request_id = _request_id.get()
+        return True
+
+class SamplingFilter(logging.Filter):
+    """Keep a random fraction of INFO and DEBUG records, except from exempt loggers"""
+
+    def __init__(self, rate, exempt=(ACCESS_LOGGER,)):
+        super().__init__()
+        self.rate = rate
+        self.exempt = frozenset(exempt)
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or self.rate >= 1.0 or record.name in self.exempt:
+            return True
+        if random.random() >= self.rate:
+            return False
+        record.sample_rate = self.rate
+        return True
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the writer thread and
+    drops records instead of blocking when the queue is full.
+    """
+
+    def __init__(self, log_queue, max_size=LOG_QUEUE_SIZE):
+        super().__init__(log_queue)
+        self.max_size = max_size
+        self.dropped = 0
+
+    def prepare(self, record):
+        # The stock prepare() formats on the calling thread; only do that when
+        # an argument might change or be unsafe to render from another thread
+        if record.args and (
+            isinstance(record.args, dict) or not all(isinstance(arg, _LAZY_ARG_TYPES) for arg in record.args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info and not record.exc_text:
+            # Tracebacks pin every frame they reference; render them now
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        # SimpleQueue is unbounded (and much cheaper to put to than Queue), so
+        # the bound is checked here; approximate under concurrency, which is fine
+        if self.queue.qsize() >= self.max_size:
+            self.dropped += 1
+            return
+        self.queue.put_nowait(record)
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, in the shape Cloud Logging parses from stdout"""
+
+    def format(self, record):
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "severity": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, 'request_id', None):
+            entry["request_id"] = record.request_id
+        entry.update({key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES})
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s')
+
+    def format(self, record):
+        if getattr(record, 'request_id', None) is None:
+            record.request_id = '-'
+        return super().format(record)
+
+def configure_logging(stream=None, level=LOG_LEVEL, fmt=LOG_FORMAT, sample_rate=LOG_INFO_SAMPLE_RATE):
+    """
+    Route the root logger through a queue to a background writer thread, so
+    request threads never wait on stdout. Safe to call more than once.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return _queue_handler
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if fmt == 'json' else TextFormatter())
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    _queue_handler.addFilter(SamplingFilter(sample_rate))
+    _queue_handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _queue_handler
+
+def init_logging(app):
+    """
+    Configure the logging pipeline and give every request an id (taken from
+    X-Request-ID or Cloud Run's trace header when present) and one access
+    log line with its latency. Replaces gunicorn's synchronous access log.
+    """
+    configure_logging()
+    access_logger = logging.getLogger(ACCESS_LOGGER)
+
+    @app.before_request
+    def start_request_log():
+        # Nested requests (batch sub-requests) keep the outer request's id
+        if _request_id.get() is None:
+            token = _request_id.set(_incoming_request_id())
+            request.environ[_ENVIRON_KEY] = (token, time.perf_counter())
+
+    @app.after_request
+    def log_request(response):
+        owned = request.environ.get(_ENVIRON_KEY)
+        if owned is None:
+            return response
+
+        _, started = owned
+        response.headers[REQUEST_ID_HEADER] = _request_id.get()
+        level = logging.WARNING if response.status_code >= 500 else logging.INFO
+        access_logger.log(
+            level, "%s %s %s", request.method, request.path, response.status_code,
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "latency_ms": round((time.perf_counter() - started) * 1000, 3)
+            }
+        )
+        return response
+
+    @app.teardown_request
+    def end_request_log(exc):
+        owned = request.environ.pop(_ENVIRON_KEY, None)
+        if owned is not None:
+            _request_id.reset(owned[0])
+
+def _incoming_request_id():
+    request_id = request.headers.get(REQUEST_ID_HEADER)
+    if not request_id:
+        # X-Cloud-Trace-Context: TRACE_ID/SPAN_ID;o=OPTIONS
+        trace = request.headers.get('X-Cloud-Trace-Context', '')
+        request_id = trace.split('/', 1)[0]
+    return request_id[:64] if request_id else uuid.uuid4().hex
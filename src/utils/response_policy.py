@@ -0,0 +1,185 @@
+from flask import current_app, request
+from src.database.connection import current_unit_of_work
+from src.database.request_scope import in_outer_unit_of_work
+from src.utils.cache import LRUCache
+import os
+import zlib
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Smaller bodies gain little from compression and cost a header and CPU
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv('RESPONSE_COMPRESSION_MIN_BYTES', 1024))
+RESPONSE_GZIP_LEVEL = int(os.getenv('RESPONSE_GZIP_LEVEL', 6))
+RESPONSE_BROTLI_QUALITY = int(os.getenv('RESPONSE_BROTLI_QUALITY', 4))
+# Lifetime of micro-cached responses for routes declared with micro_cache=True
+RESPONSE_MICRO_CACHE_SECONDS = float(os.getenv('RESPONSE_MICRO_CACHE_SECONDS', 5))
+MICRO_CACHE_MAX_ENTRIES = 256
+
+# Event streams must reach the client message by message
+UNCOMPRESSED_MIMETYPES = {'text/event-stream'}
+
+_ENVIRON_KEY = 'xsigned.micro_cache'
+
+class ResponsePolicy:
+    """Caching and compression rules for one route"""
+
+    def __init__(self, public=False, max_age=None, stale_while_revalidate=None, no_store=False,
+                 micro_cache=None, compress=True):
+        directives = []
+        if no_store:
+            directives.append('no-store')
+        else:
+            directives.append('public' if public else 'private')
+            if max_age is not None:
+                directives.append(f'max-age={max_age}')
+            if stale_while_revalidate is not None:
+                directives.append(f'stale-while-revalidate={stale_while_revalidate}')
+        self.cache_control = ', '.join(directives)
+        self.compress = compress
+
+        ttl = RESPONSE_MICRO_CACHE_SECONDS if micro_cache is True else micro_cache
+        self.micro_cache = LRUCache(MICRO_CACHE_MAX_ENTRIES, ttl) if ttl else None
+
+def response_policy(**options):
+    """
+    Declare Cache-Control, micro-caching and compression for a view. Goes
+    below @bp.route(...). See ResponsePolicy for the options.
+    """
+    policy = ResponsePolicy(**options)
+
+    def decorator(view):
+        view.response_policy = policy
+        return view
+    return decorator
+
+class _GzipEncoder:
+    name = 'gzip'
+
+    def __init__(self):
+        # wbits=31: gzip container rather than raw zlib
+        self._compressor = zlib.compressobj(RESPONSE_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush()
+
+class _BrotliEncoder:
+    name = 'br'
+
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=RESPONSE_BROTLI_QUALITY)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+def init_response_policies(app):
+    """
+    Apply route response policies: serve micro-cached GET responses, set
+    Cache-Control, and gzip/brotli-compress bodies above
+    RESPONSE_COMPRESSION_MIN_BYTES (streamed bodies chunk by chunk).
+    Routes without a policy are only compressed.
+    """
+
+    @app.before_request
+    def serve_from_micro_cache():
+        policy = _current_policy()
+        if policy is None or policy.micro_cache is None or request.method != 'GET' or _sees_uncommitted_state():
+            return None
+
+        cached = policy.micro_cache.get(request.full_path)
+        if cached is None:
+            request.environ[_ENVIRON_KEY] = 'MISS'
+            return None
+
+        request.environ[_ENVIRON_KEY] = 'HIT'
+        status, mimetype, body = cached
+        return current_app.response_class(body, status=status, mimetype=mimetype)
+
+    @app.after_request
+    def apply_response_policy(response):
+        policy = _current_policy()
+
+        if policy is not None and request.method in ('GET', 'HEAD') and _sees_uncommitted_state():
+            # May reflect writes that are rolled back later: share it with nobody
+            response.headers['Cache-Control'] = 'no-store'
+        elif policy is not None and request.method in ('GET', 'HEAD'):
+            cache_state = request.environ.get(_ENVIRON_KEY)
+            if cache_state == 'MISS' and response.status_code == 200 and not response.is_streamed:
+                policy.micro_cache.set(
+                    request.full_path, (response.status_code, response.mimetype, response.get_data())
+                )
+            if cache_state is not None:
+                response.headers['X-Micro-Cache'] = cache_state
+            response.headers.setdefault('Cache-Control', policy.cache_control)
+
+        if policy is None or policy.compress:
+            _compress(response)
+        return response
+
+def _current_policy():
+    view = current_app.view_functions.get(request.endpoint)
+    return getattr(view, 'response_policy', None)
+
+def _sees_uncommitted_state():
+    """
+    True for requests joining an outer unit of work (batch sub-requests) or
+    whose transaction has written: their responses may include writes that
+    are not committed yet, and they must see their own earlier writes
+    """
+    uow = current_unit_of_work()
+    return uow is not None and (in_outer_unit_of_work() or uow.has_uncommitted_writes)
+
+def _negotiate():
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return _BrotliEncoder()
+    if accepted['gzip']:
+        return _GzipEncoder()
+    return None
+
+def _compress(response):
+    if (
+        request.method == 'HEAD'
+        or response.status_code < 200 or response.status_code in (204, 304)
+        or response.direct_passthrough
+        or 'Content-Encoding' in response.headers
+        or response.mimetype in UNCOMPRESSED_MIMETYPES
+    ):
+        return
+
+    if not response.is_streamed and response.calculate_content_length() < RESPONSE_COMPRESSION_MIN_BYTES:
+        return
+
+    response.vary.add('Accept-Encoding')
+    encoder = _negotiate()
+    if encoder is None:
+        return
+
+    if response.is_streamed:
+        response.response = _compress_stream(response.iter_encoded(), encoder)
+        response.headers.pop('Content-Length', None)
+    else:
+        response.set_data(encoder.compress(response.get_data()) + encoder.finish())
+    response.headers['Content-Encoding'] = encoder.name
+
+def _compress_stream(chunks, encoder):
+    # Flush after every chunk so streamed output isn't held back in the compressor
+    for chunk in chunks:
+        data = encoder.compress(chunk) + encoder.flush()
+        if data:
+            yield data
+    yield encoder.finish()
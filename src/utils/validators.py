@@ -1,16 +1,49 @@
+from flask import request, jsonify
+from functools import wraps
+from marshmallow import ValidationError
+import re
+
+# The one email format accepted anywhere in the API
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+EMAIL_MAX_LENGTH = 254
+
 def is_valid_email(email):
-    import re
-    email_regex = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-    return re.match(email_regex, email) is not None
+    return isinstance(email, str) and len(email) <= EMAIL_MAX_LENGTH and EMAIL_PATTERN.match(email) is not None
+
+def validate_body(schema, optional=False):
+    """
+    Load the JSON body with schema before the view runs and pass the result
+    as body=. Invalid bodies get a 400 without the view (or a database
+    session) ever being reached.
+
+    Args:
+        schema (Schema): marshmallow schema instance, created once at import
+        optional (bool): treat a missing body as {}
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            data = request.get_json(silent=True)
+            if data is None:
+                if not optional:
+                    return jsonify({"error": "No data provided"}), 400
+                data = {}
+
+            try:
+                body = schema.load(data)
+            except ValidationError as e:
+                return jsonify({"error": _summary(e.messages), "details": e.messages}), 400
 
-def validate_user_data(user_data):
-    if 'email' not in user_data or not is_valid_email(user_data['email']):
-        raise ValueError("Invalid email address.")
-    # Additional validations can be added here
-    return True
+            return view(*args, body=body, **kwargs)
+        return wrapper
+    return decorator
 
-def validate_campaign_data(campaign_data):
-    if 'name' not in campaign_data or not campaign_data['name']:
-        raise ValueError("Campaign name is required.")
-    # Additional validations can be added here
-    return True
\ No newline at end of file
+def _summary(messages):
+    if isinstance(messages, dict):
+        field, errors = next(iter(messages.items()))
+        if field == '_schema':
+            return _summary(errors)
+        return f"{field}: {_summary(errors)}"
+    if isinstance(messages, list) and messages:
+        return _summary(messages[0])
+    return str(messages)
@@ -0,0 +1,158 @@
+"""
+Per-request logging overhead: synchronous stdout logging (the previous
+basicConfig setup plus gunicorn's --access-logfile) against the queue-based
+pipeline in src/utils/logging_setup.py.
+
+Each simulated request logs what a waitlist signup logs: one INFO line from
+the service and one access line. Only time spent on the request thread is
+measured. Between requests the thread sleeps for --request-io-us, standing
+in for the time a real request spends waiting on Postgres, during which the
+writer thread gets the GIL. Output goes to a pipe drained by a reader
+thread, the way a container's stdout is drained by the log collector;
+--sink-delay-us adds latency per chunk read to model a slow collector.
+
+    python -m tests.benchmark_logging --requests 5000 --sink-delay-us 50
+"""
+import argparse
+import logging
+import os
+import queue
+import statistics
+import threading
+import time
+from datetime import datetime
+from logging.handlers import QueueListener
+from src.utils.logging_setup import (
+    JsonFormatter, NonBlockingQueueHandler, RequestContextFilter, SamplingFilter
+)
+
+GUNICORN_ACCESS_FORMAT = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s"'
+
+class PipeSink:
+    """Write end of a pipe whose read end is drained by a background thread"""
+
+    def __init__(self, delay_us=0):
+        read_fd, write_fd = os.pipe()
+        self.stream = os.fdopen(write_fd, 'w', buffering=1)
+        self.bytes_read = 0
+        self._reader = os.fdopen(read_fd, 'rb', buffering=0)
+        self._delay = delay_us / 1e6
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self):
+        while True:
+            chunk = self._reader.read(65536)
+            if not chunk:
+                return
+            self.bytes_read += len(chunk)
+            if self._delay:
+                time.sleep(self._delay)
+
+    def close(self):
+        self.stream.close()
+        self._thread.join()
+        self._reader.close()
+
+def _logger(name, handler):
+    logger = logging.getLogger(f"benchmark.{name}")
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+def run_synchronous(requests, sink, io_seconds):
+    """logging.basicConfig-style StreamHandler, eager f-strings, gunicorn access line"""
+    handler = logging.StreamHandler(sink.stream)
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    app_logger = _logger('sync.app', handler)
+    access_handler = logging.StreamHandler(sink.stream)
+    access_logger = _logger('sync.access', access_handler)
+
+    timings = []
+    for i in range(requests):
+        started = time.perf_counter_ns()
+        email = f"fan{i}@example.com"
+        app_logger.info(f"New waitlist signup: {email}")
+        access_logger.info(GUNICORN_ACCESS_FORMAT % {
+            'h': '169.254.1.1', 'l': '-', 'u': '-',
+            't': datetime.now().strftime('[%d/%b/%Y:%H:%M:%S +0000]'),
+            'r': 'POST /api/waitlist/join HTTP/1.1', 's': 201, 'b': 112, 'f': '-', 'a': 'benchmark'
+        })
+        timings.append(time.perf_counter_ns() - started)
+        time.sleep(io_seconds)
+    return timings
+
+def run_queued(requests, sink, sample_rate, io_seconds):
+    """Queue handler, lazy %-formatting, JSON written by the listener thread"""
+    output = logging.StreamHandler(sink.stream)
+    output.setFormatter(JsonFormatter())
+    log_queue = queue.SimpleQueue()
+    handler = NonBlockingQueueHandler(log_queue, max_size=requests * 2)
+    # Like the app: access lines are never sampled, only the service's INFO line
+    handler.addFilter(SamplingFilter(sample_rate, exempt=('benchmark.queued.access',)))
+    handler.addFilter(RequestContextFilter())
+    listener = QueueListener(log_queue, output)
+    listener.start()
+
+    app_logger = _logger('queued.app', handler)
+    access_logger = _logger('queued.access', handler)
+
+    timings = []
+    for i in range(requests):
+        started = time.perf_counter_ns()
+        email = f"fan{i}@example.com"
+        app_logger.info("New waitlist signup: %s", email)
+        access_logger.log(
+            logging.INFO, "%s %s %s", 'POST', '/api/waitlist/join', 201,
+            extra={"method": 'POST', "path": '/api/waitlist/join', "status": 201, "latency_ms": 1.0}
+        )
+        timings.append(time.perf_counter_ns() - started)
+        time.sleep(io_seconds)
+
+    listener.stop()
+    return timings
+
+def _summary(timings):
+    ordered = sorted(timings)
+    return {
+        "mean_us": statistics.fmean(ordered) / 1000,
+        "p50_us": ordered[len(ordered) // 2] / 1000,
+        "p99_us": ordered[int(len(ordered) * 0.99)] / 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-request logging overhead on the request thread")
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--request-io-us', type=int, default=500, help="simulated database wait per request")
+    parser.add_argument('--sink-delay-us', type=int, default=0, help="delay per chunk read from stdout")
+    parser.add_argument('--sample-rate', type=float, default=0.1, help="INFO sample rate for the sampled run")
+    args = parser.parse_args()
+
+    io_seconds = args.request_io_us / 1e6
+    runs = [
+        ("synchronous stdout + access log", lambda sink: run_synchronous(args.requests, sink, io_seconds)),
+        ("queued, unsampled", lambda sink: run_queued(args.requests, sink, 1.0, io_seconds)),
+        (f"queued, INFO sampled at {args.sample_rate}",
+         lambda sink: run_queued(args.requests, sink, args.sample_rate, io_seconds)),
+    ]
+
+    results = []
+    for label, run in runs:
+        sink = PipeSink(args.sink_delay_us)
+        timings = run(sink)
+        sink.close()
+        results.append((label, _summary(timings), sink.bytes_read))
+
+    baseline = results[0][1]["mean_us"]
+    print(f"{args.requests} requests, {args.request_io_us}us simulated I/O each, sink delay {args.sink_delay_us}us per read")
+    print(f"{'setup':<36} {'mean us':>9} {'p50 us':>9} {'p99 us':>9} {'saved':>7} {'bytes out':>11}")
+    for label, summary, bytes_out in results:
+        saved = 1 - summary["mean_us"] / baseline
+        print(
+            f"{label:<36} {summary['mean_us']:>9.2f} {summary['p50_us']:>9.2f} {summary['p99_us']:>9.2f} "
+            f"{saved:>7.0%} {bytes_out:>11}"
+        )
+
+if __name__ == '__main__':
+    main()
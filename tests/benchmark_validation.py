@@ -0,0 +1,97 @@
+"""
+Per-request validation cost: the ad-hoc checks the routes and services used
+to do (copied below as they were) against the marshmallow schemas in
+src/schemas, for valid and invalid bodies.
+
+Only CPU time is measured. For invalid bodies the old checks could also let
+the request reach the database (e.g. an unknown campaign status failed on
+INSERT), which the schemas now prevent entirely; that saving is not counted.
+
+    python -m tests.benchmark_validation --iterations 100000
+"""
+import argparse
+import re
+import timeit
+from src.schemas.campaign import create_campaign_schema
+from src.schemas.user import create_user_schema, waitlist_signup_schema
+from src.utils.validators import EMAIL_PATTERN
+from marshmallow import ValidationError
+
+LEGACY_USER_EMAIL = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+LEGACY_VALIDATORS_EMAIL = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
+
+def legacy_create_user(data):
+    if not data:
+        return False
+    email = data.get('email')
+    artist_name = data.get('artist_name')
+    if not email:
+        return False
+    if re.match(LEGACY_USER_EMAIL, email) is None:
+        return False
+    return email.lower().strip(), artist_name.strip() if artist_name else None
+
+def legacy_waitlist_join(data):
+    if not data:
+        return False
+    email = data.get('email')
+    if not email:
+        return False
+    if not email or re.match(LEGACY_VALIDATORS_EMAIL, email) is None:
+        return False
+    return email.lower().strip()
+
+def legacy_create_campaign(data):
+    if not data:
+        return False
+    user_id = data.get('user_id')
+    name = data.get('name')
+    status = data.get('status')
+    if not user_id or not name:
+        return False
+    # status went to the database unchecked
+    return user_id, name, status
+
+def schema_load(schema):
+    def load(data):
+        try:
+            return schema.load(data)
+        except ValidationError:
+            return False
+    return load
+
+CASES = [
+    ("create user", legacy_create_user, schema_load(create_user_schema),
+     {"email": "Fan.Name@Example.com", "artist_name": "The Examples"}),
+    ("create user, bad email", legacy_create_user, schema_load(create_user_schema),
+     {"email": "not-an-email", "artist_name": "The Examples"}),
+    ("waitlist join", legacy_waitlist_join, schema_load(waitlist_signup_schema),
+     {"email": "fan@example.com"}),
+    ("create campaign", legacy_create_campaign, schema_load(create_campaign_schema),
+     {"user_id": 42, "name": "Summer tour", "status": "active"}),
+    ("create campaign, bad status", legacy_create_campaign, schema_load(create_campaign_schema),
+     {"user_id": 42, "name": "Summer tour", "status": "bogus"}),
+]
+
+def _per_call_us(function, argument, iterations):
+    return min(timeit.repeat(lambda: function(argument), number=iterations, repeat=3)) / iterations * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare request body validation cost per request")
+    parser.add_argument('--iterations', type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'case':<30} {'ad-hoc us':>10} {'schema us':>10} {'rejects':>16}")
+    for label, legacy, schema, body in CASES:
+        legacy_us = _per_call_us(legacy, body, args.iterations)
+        schema_us = _per_call_us(schema, body, args.iterations)
+        rejects = f"{'yes' if legacy(body) is False else 'no'} / {'yes' if schema(body) is False else 'no'}"
+        print(f"{label:<30} {legacy_us:>10.2f} {schema_us:>10.2f} {rejects:>16}")
+
+    email = "fan.name@example.com"
+    uncompiled = _per_call_us(lambda value: re.match(LEGACY_USER_EMAIL, value), email, args.iterations)
+    compiled = _per_call_us(EMAIL_PATTERN.match, email, args.iterations)
+    print(f"\nemail regex: re.match(pattern) {uncompiled:.3f}us, precompiled {compiled:.3f}us")
+
+if __name__ == '__main__':
+    main()
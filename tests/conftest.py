@@ -0,0 +1,15 @@
+import os
+import pytest
+
+# Point the app at the test database before any src module creates the engine
+TEST_DATABASE_URL = os.getenv('TEST_DATABASE_URL')
+if TEST_DATABASE_URL:
+    os.environ['DATABASE_URL'] = TEST_DATABASE_URL
+    os.environ.pop('DB_HOST', None)
+
+@pytest.fixture(scope='session')
+def database():
+    """Create tables (and run migrations) in the test database once per session"""
+    from src.database.connection import init_db, engine
+    init_db()
+    return engine
@@ -0,0 +1,5 @@
+import os
+import pytest
+
+# conftest.py points DATABASE_URL at this database when it is set
+requires_db = pytest.mark.skipif(not os.getenv('TEST_DATABASE_URL'), reason="TEST_DATABASE_URL is not set")
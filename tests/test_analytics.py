@@ -0,0 +1,19 @@
+from datetime import datetime
+from src.services.analytics_service import AnalyticsService
+
+def test_offset_timestamps_are_converted_to_naive_utc():
+    assert AnalyticsService._parse_timestamp("2026-01-01T00:00:00Z") == datetime(2026, 1, 1)
+    assert AnalyticsService._parse_timestamp("2026-01-01T02:00:00+02:00") == datetime(2026, 1, 1)
+    assert AnalyticsService._parse_timestamp("2026-01-01T00:00:00") == datetime(2026, 1, 1)
+
+def test_mixed_naive_and_offset_range_is_validated_not_crashing():
+    # Only from is given with an offset; to defaults to naive utcnow()
+    result, status_code = AnalyticsService.get_timeseries(bucket='hour', start="2000-01-01T00:00:00Z")
+    assert status_code == 400
+    assert "Range too large" in result["error"]
+
+def test_unparseable_timestamps_are_rejected():
+    result, status_code = AnalyticsService.get_timeseries(bucket='day', start="yesterday")
+    assert status_code == 400
+    _, status_code = AnalyticsService.get_timeseries(bucket='day', end="0001-01-01T00:00:00")
+    assert status_code == 400
@@ -0,0 +1,115 @@
+import uuid
+import pytest
+from flask import Flask, Response, jsonify, request
+from src.routes.batch import batch_bp
+from src.services.batch_service import BatchReferenceError, BatchService
+from src.services.user_service import UserService
+from tests.helpers import requires_db
+
+PREVIOUS = [
+    {"id": "user", "status": 201, "body": {"user": {"id": 7, "tags": ["a", "b"]}}},
+    {"id": "broken", "status": 409, "body": {"error": "exists"}},
+]
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(batch_bp)
+    ran = []
+
+    @app.route('/api/echo', methods=['POST'])
+    def echo():
+        ran.append('echo')
+        return jsonify(request.get_json()), 201
+
+    @app.route('/api/conflict', methods=['POST'])
+    def conflict():
+        ran.append('conflict')
+        return jsonify({"error": "exists"}), 409
+
+    @app.route('/api/stream')
+    def stream():
+        return Response(iter(["data: 1\n\n"]), mimetype='text/event-stream')
+
+    client = app.test_client()
+    client.ran = ran
+    return client
+
+def test_lone_placeholder_keeps_its_type():
+    assert BatchService._resolve("{{ user.user.id }}", PREVIOUS) == 7
+    assert BatchService._resolve({"ids": ["{{0.user.tags.1}}"]}, PREVIOUS) == {"ids": ["b"]}
+    assert BatchService._resolve("/api/users/{{user.user.id}}", PREVIOUS) == "/api/users/7"
+
+@pytest.mark.parametrize("value", ["{{missing.id}}", "{{5}}", "{{broken.error}}", "{{user.user.name}}"])
+def test_unavailable_references_raise(value):
+    with pytest.raises(BatchReferenceError):
+        BatchService._resolve(value, PREVIOUS)
+
+def test_bad_reference_is_a_400_sub_response(client):
+    response = client.post('/api/batch', json={"requests": [
+        {"method": "POST", "path": "/api/conflict", "id": "first"},
+        {"method": "POST", "path": "/api/echo", "body": {"id": "{{first.id}}"}},
+        {"method": "POST", "path": "/api/echo", "body": {"id": "{{nope.id}}"}},
+    ]})
+
+    statuses = [item["status"] for item in response.get_json()["responses"]]
+    assert response.status_code == 200
+    assert statuses == [409, 400, 400]
+
+def test_streaming_endpoints_are_rejected(client):
+    response = client.post('/api/batch', json={"requests": [{"method": "GET", "path": "/api/stream"}]})
+
+    assert response.get_json()["responses"][0]["status"] == 400
+
+@pytest.mark.parametrize("path", ["/api/batch", "/api/batch/", "/api/batch?x=1", "/api/batch#x"])
+def test_batches_cannot_be_nested(client, path):
+    nested = {"requests": [{"method": "POST", "path": "/api/echo", "body": {}}]}
+    response = client.post('/api/batch', json={"requests": [{"method": "POST", "path": path, "body": nested}]})
+
+    assert response.get_json()["responses"][0]["status"] == 400
+    assert client.ran == []
+
+def test_atomic_batch_stops_at_first_failure(client):
+    response = client.post('/api/batch', json={"atomic": True, "requests": [
+        {"method": "POST", "path": "/api/echo", "body": {"n": 1}},
+        {"method": "POST", "path": "/api/conflict"},
+        {"method": "POST", "path": "/api/echo", "body": {"n": 2}},
+    ]})
+
+    assert response.status_code == 409
+    assert response.get_json()["committed"] is False
+    assert len(response.get_json()["responses"]) == 2
+    assert client.ran == ['echo', 'conflict']
+
+@requires_db
+def test_atomic_batch_rolls_back_earlier_writes(database):
+    from src.app import create_app
+    email = f"batch-{uuid.uuid4().hex[:12]}@example.com"
+    client = create_app().test_client()
+
+    response = client.post('/api/batch', json={"atomic": True, "requests": [
+        {"method": "POST", "path": "/api/users/", "body": {"email": email}, "id": "user"},
+        {"method": "POST", "path": "/api/users/", "body": {"email": email}},
+    ]})
+
+    body = response.get_json()
+    assert response.status_code == 409
+    assert [item["status"] for item in body["responses"]] == [201, 409]
+    assert UserService.get_user_by_id(body["responses"][0]["body"]["user"]["id"])[1] == 404
+
+@requires_db
+@pytest.mark.parametrize("job", ["/api/campaigns/archive", "/api/waitlist/stats/rollup"])
+def test_self_committing_jobs_do_not_commit_the_batch(database, job):
+    from src.app import create_app
+    email = f"batch-{uuid.uuid4().hex[:12]}@example.com"
+    client = create_app().test_client()
+
+    response = client.post('/api/batch', json={"atomic": True, "requests": [
+        {"method": "POST", "path": "/api/users/", "body": {"email": email}},
+        {"method": "POST", "path": job, "body": {}},
+        {"method": "POST", "path": "/api/users/", "body": {"email": email}},
+    ]})
+
+    body = response.get_json()
+    assert [item["status"] for item in body["responses"]] == [201, 200, 409]
+    assert UserService.get_user_by_id(body["responses"][0]["body"]["user"]["id"])[1] == 404
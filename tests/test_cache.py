@@ -0,0 +1,43 @@
+import time
+from src.utils.cache import LRUCache
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2, ttl_seconds=60)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    cache.get(1)
+    cache.set(3, "c")
+
+    assert cache.get(2) is None
+    assert cache.get(1) == "a"
+    assert cache.get(3) == "c"
+    assert cache.stats()["evictions"] == 1
+
+def test_entries_expire_after_ttl():
+    cache = LRUCache(max_entries=10, ttl_seconds=0.01)
+    cache.set(1, "a")
+    time.sleep(0.02)
+
+    assert cache.get(1) is None
+    assert cache.stats()["expirations"] == 1
+
+def test_counts_hits_and_misses():
+    cache = LRUCache()
+    cache.get(1)
+    cache.set(1, "a")
+    cache.get(1)
+    cache.get(1)
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_ratio"] == round(2 / 3, 4)
+
+def test_set_is_skipped_after_concurrent_invalidation():
+    """A row loaded before an invalidation must not be cached after it"""
+    cache = LRUCache()
+    generation = cache.generation()
+    cache.invalidate(1)
+
+    assert cache.set(1, "stale", generation) is False
+    assert cache.get(1) is None
+    assert cache.set(1, "fresh", cache.generation()) is True
@@ -0,0 +1,44 @@
+import threading
+import pytest
+from flask import Flask
+from src.routes import campaigns
+from src.routes.campaigns import campaigns_bp
+from src.services.campaign_events import CampaignEventHub
+from src.services.campaign_service import CampaignService
+
+class StubListener:
+    """Stands in for PgListener so no LISTEN thread or connection is started"""
+
+    def subscribe(self, channel, callback):
+        pass
+
+    def on_reconnect(self, callback):
+        pass
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(campaigns, 'campaign_events', CampaignEventHub(StubListener()))
+    monkeypatch.setattr(campaigns, '_stream_slots', threading.BoundedSemaphore(1))
+    monkeypatch.setattr(
+        CampaignService, 'get_campaign_progress',
+        staticmethod(lambda campaign_id: ({"campaign": {"id": campaign_id}, "progress": 0}, 200))
+    )
+    app = Flask(__name__)
+    app.register_blueprint(campaigns_bp, url_prefix='/api/campaigns')
+    return app.test_client()
+
+def test_streams_beyond_the_limit_get_503_with_retry_after(client):
+    first = client.get('/api/campaigns/1/events', buffered=False)
+    second = client.get('/api/campaigns/1/events')
+
+    assert first.status_code == 200
+    assert second.status_code == 503
+    assert second.headers['Retry-After'] == str(campaigns.SSE_BUSY_RETRY_AFTER_SECONDS)
+    first.close()
+
+def test_closing_a_stream_frees_its_slot(client):
+    client.get('/api/campaigns/1/events', buffered=False).close()
+
+    response = client.get('/api/campaigns/1/events', buffered=False)
+    assert response.status_code == 200
+    response.close()
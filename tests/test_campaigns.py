@@ -1,41 +1,52 @@
+import os
 import unittest
-from src.models.campaign import Campaign
+import uuid
+from src.models.campaign import CampaignStatus
 from src.services.campaign_service import CampaignService
+from src.services.user_service import UserService
 
+@unittest.skipUnless(os.getenv('TEST_DATABASE_URL'), "TEST_DATABASE_URL is not set")
 class TestCampaignService(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        from src.database.connection import init_db
+        init_db()
+
     def setUp(self):
         self.campaign_service = CampaignService()
+        result, _ = UserService.create_user(f"artist-{uuid.uuid4().hex[:12]}@example.com", "Test Artist")
+        self.user_id = result['user']['id']
 
     def test_create_campaign(self):
-        campaign_data = {
-            'name': 'Summer Music Festival',
-            'status': 'active'
-        }
-        campaign = self.campaign_service.create_campaign(campaign_data)
-        self.assertIsNotNone(campaign.id)
-        self.assertEqual(campaign.name, campaign_data['name'])
-        self.assertEqual(campaign.status, campaign_data['status'])
+        result, status_code = self.campaign_service.create_campaign(
+            self.user_id, 'Summer Music Festival', CampaignStatus.ACTIVE
+        )
+        self.assertEqual(status_code, 201)
+        self.assertIsNotNone(result['campaign']['id'])
+        self.assertEqual(result['campaign']['name'], 'Summer Music Festival')
+        self.assertEqual(result['campaign']['status'], 'active')
 
     def test_get_campaign(self):
-        campaign_data = {
-            'name': 'Winter Music Festival',
-            'status': 'inactive'
-        }
-        campaign = self.campaign_service.create_campaign(campaign_data)
-        fetched_campaign = self.campaign_service.get_campaign(campaign.id)
-        self.assertEqual(fetched_campaign.name, campaign_data['name'])
-        self.assertEqual(fetched_campaign.status, campaign_data['status'])
+        created, _ = self.campaign_service.create_campaign(self.user_id, 'Winter Music Festival')
+        result, status_code = self.campaign_service.get_campaign(created['campaign']['id'])
+        self.assertEqual(status_code, 200)
+        self.assertEqual(result['campaign']['name'], 'Winter Music Festival')
+        self.assertEqual(result['campaign']['status'], 'draft')
+
+    def test_get_missing_campaign(self):
+        result, status_code = self.campaign_service.get_campaign(0)
+        self.assertEqual(status_code, 404)
 
     def test_update_campaign_progress(self):
-        campaign_data = {
-            'name': 'Spring Music Festival',
-            'status': 'active'
-        }
-        campaign = self.campaign_service.create_campaign(campaign_data)
-        self.campaign_service.update_campaign_progress(campaign.id, '50%')
-        updated_campaign = self.campaign_service.get_campaign(campaign.id)
-        self.assertEqual(updated_campaign.progress, '50%')
+        created, _ = self.campaign_service.create_campaign(
+            self.user_id, 'Spring Music Festival', CampaignStatus.ACTIVE
+        )
+        campaign_id = created['campaign']['id']
+        self.campaign_service.update_campaign_progress(campaign_id, {'campaign_data': {'progress': '50%'}})
+        result, status_code = self.campaign_service.get_campaign(campaign_id)
+        self.assertEqual(status_code, 200)
+        self.assertEqual(result['campaign']['campaign_data'], {'progress': '50%'})
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
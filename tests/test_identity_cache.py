@@ -0,0 +1,37 @@
+import time
+import uuid
+from src.services.campaign_service import CampaignService
+from src.services.identity_cache import CAMPAIGN, identity_cache
+from src.services.user_service import UserService
+from tests.helpers import requires_db
+
+def _wait_until_caching(user_id):
+    # The first set() starts LISTEN, whose connect callback clears the cache
+    other, _ = CampaignService.create_campaign(user_id, 'Warm Up')
+    deadline = time.monotonic() + 5
+    while identity_cache.get(CAMPAIGN, other["campaign"]["id"]) is None and time.monotonic() < deadline:
+        CampaignService.get_campaign(other["campaign"]["id"])
+        time.sleep(0.05)
+
+@requires_db
+def test_rolled_back_batch_leaves_nothing_in_the_cache(database):
+    from src.app import create_app
+    user, _ = UserService.create_user(f"cache-{uuid.uuid4().hex[:12]}@example.com")
+    created, _ = CampaignService.create_campaign(user["user"]["id"], 'Cache Tour')
+    campaign_id = created["campaign"]["id"]
+    _wait_until_caching(user["user"]["id"])
+    client = create_app().test_client()
+
+    response = client.post('/api/batch', json={"atomic": True, "requests": [
+        {"method": "PATCH", "path": f"/api/campaigns/{campaign_id}/progress", "body": {"name": "Uncommitted"}},
+        {"method": "GET", "path": f"/api/campaigns/{campaign_id}"},
+        {"method": "GET", "path": "/api/campaigns/0"},
+    ]})
+
+    body = response.get_json()
+    assert response.status_code == 404
+    # Within the batch the GET sees the batch's own write...
+    assert body["responses"][1]["body"]["campaign"]["name"] == "Uncommitted"
+    # ...but it was never cached, so the rollback leaves no trace
+    assert identity_cache.get(CAMPAIGN, campaign_id) is None
+    assert CampaignService.get_campaign(campaign_id)[0]["campaign"]["name"] == 'Cache Tour'
@@ -0,0 +1,40 @@
+import logging
+import queue
+from src.utils.logging_setup import ACCESS_LOGGER, NonBlockingQueueHandler, SamplingFilter
+
+def _record(msg, *args, level=logging.INFO, name='test'):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+def test_plain_arguments_are_formatted_on_the_writer_thread():
+    handler = NonBlockingQueueHandler(queue.SimpleQueue())
+    record = handler.prepare(_record("New waitlist signup: %s", "fan@example.com"))
+
+    assert record.args == ("fan@example.com",)
+    assert record.getMessage() == "New waitlist signup: fan@example.com"
+
+def test_mutable_arguments_are_formatted_immediately():
+    payload = {"status": "draft"}
+    handler = NonBlockingQueueHandler(queue.SimpleQueue())
+    record = handler.prepare(_record("Campaign %s", payload))
+    payload["status"] = "active"
+
+    assert record.getMessage() == "Campaign {'status': 'draft'}"
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = NonBlockingQueueHandler(queue.SimpleQueue(), max_size=1)
+    handler.handle(_record("first"))
+    handler.handle(_record("second"))
+
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+
+def test_sampling_never_drops_warnings():
+    sampling = SamplingFilter(0.0)
+
+    assert not sampling.filter(_record("routine"))
+    assert sampling.filter(_record("slow query", level=logging.WARNING))
+
+def test_sampling_never_drops_access_lines():
+    sampling = SamplingFilter(0.0)
+
+    assert sampling.filter(_record("%s %s %s", "GET", "/api/users/1", 404, name=ACCESS_LOGGER))
@@ -0,0 +1,33 @@
+import pytest
+from sqlalchemy import text
+from migrations.indexes import create_index_concurrently
+from tests.helpers import requires_db
+
+@pytest.fixture
+def connection(database):
+    with database.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        connection.execute(text("DROP TABLE IF EXISTS migration_probe"))
+        connection.execute(text("CREATE TABLE migration_probe (n integer)"))
+        connection.execute(text("INSERT INTO migration_probe VALUES (1), (1)"))
+        yield connection
+        connection.execute(text("DROP TABLE migration_probe"))
+
+def _is_valid(connection, index):
+    return connection.execute(
+        text("SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :index"),
+        {"index": index}
+    ).scalar()
+
+@requires_db
+def test_invalid_index_from_failed_build_is_rebuilt(connection):
+    # A unique build over duplicate rows fails and leaves an INVALID index behind
+    with pytest.raises(Exception):
+        connection.execute(text("CREATE UNIQUE INDEX CONCURRENTLY ix_migration_probe_n ON migration_probe (n)"))
+    assert _is_valid(connection, 'ix_migration_probe_n') is False
+
+    assert create_index_concurrently(connection, 'ix_migration_probe_n', "migration_probe (n)") is True
+    assert _is_valid(connection, 'ix_migration_probe_n') is True
+
+@requires_db
+def test_failed_index_build_is_reported_not_raised(connection):
+    assert create_index_concurrently(connection, 'ix_migration_probe_missing', "migration_probe (missing)") is False
@@ -0,0 +1,133 @@
+"""
+Query-plan regression tests.
+
+Every query issued by the model classmethods is captured as it would be sent
+to Postgres, then EXPLAINed against a database seeded with synthetic data at
+production-like volume (see tests/synthetic_data.py). A sequential scan means
+an index is missing or no longer usable, and fails the test before it shows
+up as latency in production.
+
+Requires TEST_DATABASE_URL. PLAN_TEST_USERS controls the data volume
+(default 1,000,000 users and waitlist entries, ~2M campaigns, ~4M tasks);
+an already-seeded database of at least that size is reused.
+"""
+import os
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from src.database.base import Base
+from src.models.user import User
+from src.models.campaign import Campaign, CampaignTask
+from src.models.waitlist import Waitlist
+from src.models import analytics, archive  # noqa: F401 (register every mapped model)
+from tests.helpers import requires_db
+from tests.synthetic_data import generate
+
+PLAN_TEST_USERS = int(os.getenv('PLAN_TEST_USERS', 1000000))
+
+# Picked from the middle of the generated id/email ranges
+SAMPLE_ID = PLAN_TEST_USERS // 2
+
+MODEL_QUERIES = {
+    'User.get_by_email': lambda session: User.get_by_email(session, f"user{SAMPLE_ID}@example.com"),
+    'User.get_by_id': lambda session: User.get_by_id(session, SAMPLE_ID),
+    'User.get_all': lambda session: User.get_all(session),
+    'Campaign.get_by_id': lambda session: Campaign.get_by_id(session, SAMPLE_ID),
+    'Campaign.get_by_user': lambda session: Campaign.get_by_user(session, SAMPLE_ID),
+    'Campaign.search': lambda session: Campaign.search(session, 'vinyl premiere', user_id=SAMPLE_ID),
+    'CampaignTask.get_for_campaign': lambda session: CampaignTask.get_for_campaign(session, SAMPLE_ID, SAMPLE_ID),
+    'Waitlist.get_by_email': lambda session: Waitlist.get_by_email(session, f"fan{SAMPLE_ID}@example.com"),
+    'Waitlist.get_all': lambda session: Waitlist.get_all(session),
+    'Waitlist.count_total': lambda session: Waitlist.count_total(session),
+}
+
+# Queries that read every row by design; a sequential scan is the right plan
+FULL_TABLE_READS = {
+    'User.get_all': "returns every active user (nearly the whole table)",
+    'Waitlist.count_total': "counts every row",
+}
+
+# Classmethods deliberately not plan-checked
+NOT_PLAN_CHECKED = {
+    'RollupWatermark.get_for_update': "one row per metric",
+    'CampaignArchive.get_by_id': "primary-key lookup on a table the generator does not fill",
+}
+
+class _CapturedStatement(Exception):
+    def __init__(self, statement, parameters):
+        super().__init__(statement)
+        self.statement = statement
+        self.parameters = parameters
+
+def capture_statement(engine, call):
+    """Run call(session) up to its first query and return that query instead of executing it"""
+    def intercept(conn, cursor, statement, parameters, context, executemany):
+        raise _CapturedStatement(statement, parameters)
+
+    event.listen(engine, 'before_cursor_execute', intercept)
+    try:
+        with Session(engine) as session:
+            call(session)
+    except _CapturedStatement as captured:
+        return captured.statement, captured.parameters
+    finally:
+        event.remove(engine, 'before_cursor_execute', intercept)
+    raise AssertionError("call did not issue a query")
+
+def explain(engine, statement, parameters):
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("EXPLAIN (FORMAT JSON) " + statement, parameters)
+        return cursor.fetchone()[0][0]["Plan"]
+    finally:
+        connection.close()
+
+def plan_nodes(plan):
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from plan_nodes(child)
+
+@pytest.fixture(scope='module')
+def seeded_engine(database):
+    with database.connect() as connection:
+        users = connection.execute(text("SELECT count(*) FROM users")).scalar()
+        waitlist = connection.execute(text("SELECT count(*) FROM waitlist")).scalar()
+    if users < PLAN_TEST_USERS or waitlist < PLAN_TEST_USERS:
+        generate(database, users=PLAN_TEST_USERS, waitlist=PLAN_TEST_USERS)
+    return database
+
+def test_every_model_query_is_covered():
+    """New classmethods must be added to MODEL_QUERIES (or explicitly excluded)"""
+    uncovered = []
+    for mapper in Base.registry.mappers:
+        model = mapper.class_
+        for name, attribute in vars(model).items():
+            qualified = f"{model.__name__}.{name}"
+            if isinstance(attribute, classmethod) and qualified not in MODEL_QUERIES and qualified not in NOT_PLAN_CHECKED:
+                uncovered.append(qualified)
+    assert not uncovered, f"Add plan checks for: {', '.join(sorted(uncovered))}"
+
+@requires_db
+@pytest.mark.parametrize('name', sorted(MODEL_QUERIES))
+def test_query_plan_avoids_sequential_scans(seeded_engine, name):
+    statement, parameters = capture_statement(seeded_engine, MODEL_QUERIES[name])
+    plan = explain(seeded_engine, statement, parameters)
+    nodes = list(plan_nodes(plan))
+
+    if name in FULL_TABLE_READS:
+        relations = {node["Relation Name"] for node in nodes if "Relation Name" in node}
+        assert len(relations) == 1, f"{name} should read a single table, plan touches {relations}"
+        return
+
+    seq_scans = [node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"]
+    assert not seq_scans, (
+        f"{name} sequentially scans {', '.join(seq_scans)}; is an index missing?\n{statement}"
+    )
+
+@requires_db
+def test_ordered_waitlist_listing_uses_index_order(seeded_engine):
+    """Waitlist.get_all must read joined_at in index order instead of sorting the whole table"""
+    statement, parameters = capture_statement(seeded_engine, MODEL_QUERIES['Waitlist.get_all'])
+    plan = explain(seeded_engine, statement, parameters)
+    assert not [node for node in plan_nodes(plan) if node["Node Type"] == "Sort"]
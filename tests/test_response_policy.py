@@ -0,0 +1,72 @@
+import gzip
+import pytest
+from flask import Flask, Response, jsonify
+from src.routes.batch import batch_bp
+from src.utils.response_policy import RESPONSE_COMPRESSION_MIN_BYTES, init_response_policies, response_policy
+
+LARGE_BODY = "x" * (RESPONSE_COMPRESSION_MIN_BYTES * 2)
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    init_response_policies(app)
+    calls = {"stats": 0}
+
+    @app.route('/stats')
+    @response_policy(public=True, max_age=30, stale_while_revalidate=60, micro_cache=True)
+    def stats():
+        calls["stats"] += 1
+        return jsonify({"calls": calls["stats"]})
+
+    @app.route('/api/stats')
+    @response_policy(public=True, max_age=30, micro_cache=True)
+    def api_stats():
+        calls["stats"] += 1
+        return jsonify({"calls": calls["stats"]})
+
+    @app.route('/large')
+    def large():
+        return jsonify({"body": LARGE_BODY})
+
+    @app.route('/events')
+    def events():
+        return Response((f"data: {LARGE_BODY}\n\n" for _ in range(2)), mimetype='text/event-stream')
+
+    app.register_blueprint(batch_bp)
+    return app.test_client()
+
+def test_cacheable_route_is_micro_cached_with_cache_control(client):
+    first = client.get('/stats')
+    second = client.get('/stats')
+
+    assert first.headers['Cache-Control'] == 'public, max-age=30, stale-while-revalidate=60'
+    assert (first.headers['X-Micro-Cache'], second.headers['X-Micro-Cache']) == ('MISS', 'HIT')
+    assert second.get_json() == {"calls": 1}
+
+def test_large_bodies_are_gzipped_when_accepted(client):
+    response = client.get('/large', headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert LARGE_BODY in gzip.decompress(response.data).decode()
+
+def test_small_or_unaccepted_bodies_are_not_compressed(client):
+    assert 'Content-Encoding' not in client.get('/stats', headers={"Accept-Encoding": "gzip"}).headers
+    assert 'Content-Encoding' not in client.get('/large').headers
+
+def test_event_streams_are_never_compressed(client):
+    response = client.get('/events', headers={"Accept-Encoding": "gzip"})
+
+    assert 'Content-Encoding' not in response.headers
+    assert response.data.startswith(b"data: ")
+
+def test_batch_sub_requests_bypass_the_micro_cache(client):
+    batch = {"requests": [{"method": "GET", "path": "/api/stats"}]}
+
+    in_batch = client.post('/api/batch', json=batch).get_json()["responses"][0]["body"]
+    outside = client.get('/api/stats')
+    in_batch_again = client.post('/api/batch', json=batch).get_json()["responses"][0]["body"]
+
+    assert in_batch == {"calls": 1}
+    assert outside.headers['X-Micro-Cache'] == 'MISS'
+    assert in_batch_again == {"calls": 3}
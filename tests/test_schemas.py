@@ -0,0 +1,29 @@
+import pytest
+from marshmallow import ValidationError
+from src.models.campaign import CampaignStatus
+from src.schemas.campaign import create_campaign_schema, update_campaign_progress_schema
+from src.schemas.user import create_user_schema
+from src.utils.validators import is_valid_email
+
+def test_email_is_normalized_and_unknown_keys_dropped():
+    body = create_user_schema.load({"email": " Fan@Example.COM ", "plan": "pro"})
+    assert body == {"email": "fan@example.com", "artist_name": None}
+
+@pytest.mark.parametrize('email', ["fan", "fan@example", "fan@example.c", "a" * 250 + "@example.com"])
+def test_invalid_emails_are_rejected(email):
+    assert not is_valid_email(email)
+    with pytest.raises(ValidationError):
+        create_user_schema.load({"email": email})
+
+def test_campaign_status_is_loaded_as_enum():
+    body = create_campaign_schema.load({"user_id": 1, "name": "Summer tour", "status": "active"})
+    assert body["status"] is CampaignStatus.ACTIVE
+
+def test_unknown_campaign_status_is_rejected():
+    with pytest.raises(ValidationError) as error:
+        create_campaign_schema.load({"user_id": 1, "name": "Summer tour", "status": "archived"})
+    assert "status" in error.value.messages
+
+def test_progress_update_only_accepts_campaign_fields():
+    with pytest.raises(ValidationError):
+        update_campaign_progress_schema.load({"id": 7, "user_id": 2})
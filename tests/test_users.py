@@ -1,30 +1,38 @@
+import uuid
 import pytest
 from src.models.user import User
 from src.services.user_service import UserService
+from tests.helpers import requires_db
 
 @pytest.fixture
 def user_service():
     return UserService()
 
-def test_create_user(user_service):
-    user_data = {
-        "email": "test@example.com"
-    }
-    user = user_service.create_user(user_data)
-    assert user.email == user_data["email"]
-    assert user.id is not None
+@pytest.fixture
+def email():
+    return f"test-{uuid.uuid4().hex[:12]}@example.com"
+
+@requires_db
+def test_create_user(user_service, database, email):
+    result, status_code = user_service.create_user(email)
+    assert status_code == 201
+    assert result["user"]["email"] == email
+    assert result["user"]["id"] is not None
+
+@requires_db
+def test_get_user(user_service, database, email):
+    created, _ = user_service.create_user(email)
+    result, status_code = user_service.get_user_by_id(created["user"]["id"])
+    assert status_code == 200
+    assert result["user"]["email"] == email
 
-def test_get_user(user_service):
-    user_data = {
-        "email": "test@example.com"
-    }
-    user = user_service.create_user(user_data)
-    retrieved_user = user_service.get_user(user.id)
-    assert retrieved_user.email == user.email
+@requires_db
+def test_create_duplicate_user(user_service, database, email):
+    user_service.create_user(email)
+    result, status_code = user_service.create_user(email)
+    assert status_code == 409
 
 def test_create_user_invalid_email(user_service):
-    user_data = {
-        "email": "invalid-email"
-    }
-    with pytest.raises(ValueError):
-        user_service.create_user(user_data)
\ No newline at end of file
+    result, status_code = user_service.create_user("invalid-email")
+    assert status_code == 400
+    assert "error" in result